@@ -3,26 +3,34 @@ from ..tools.knowledge import SchemeKnowledgeRetriever, SchemeLookupInput
 from ..tools.definitions import ToolOutput
 from .schemas import PlanStep
 from ..utils.logger import logger
+from ..utils.metrics import TOOL_CALLS
 
 class Executor:
     def __init__(self):
         self.eligibility_engine = EligibilityEngine()
         self.knowledge_retriever = SchemeKnowledgeRetriever()
 
-    async def execute(self, tool_call: PlanStep) -> ToolOutput:
-        logger.info(f"[EXECUTING] {tool_call.tool_name} with {tool_call.arguments}")
+    async def execute(self, tool_call: PlanStep, memory=None) -> ToolOutput:
+        logger.info("[EXECUTING] %s with %s", tool_call.tool_name, tool_call.arguments)
         
         name = tool_call.tool_name.lower()
         args = tool_call.arguments
         
         try:
             if name == "check_eligibility":
+                scheme_id = args.get("scheme_id")
+                if memory is not None:
+                    cached = self._eligibility_from_profile(args, scheme_id, memory)
+                    if cached is not None:
+                        TOOL_CALLS.inc(tool=name, source="cache")
+                        return cached
                 # Clean args mapping
                 input_data = EligibilityInput(**args)
-                scheme_id = args.get("scheme_id")
+                TOOL_CALLS.inc(tool=name, source="engine")
                 return self.eligibility_engine.check(input_data, scheme_id)
 
             elif name == "search_schemes":
+                TOOL_CALLS.inc(tool=name, source="engine")
                 input_data = SchemeLookupInput(**args)
                 return self.knowledge_retriever.search(input_data)
             
@@ -32,3 +40,14 @@ class Executor:
         except Exception as e:
             logger.error(f"Execution Error: {e}")
             return ToolOutput(success=False, error=str(e))
+
+    def _eligibility_from_profile(self, args: dict, scheme_id: str, memory) -> ToolOutput | None:
+        """
+        Treats the planner's arguments as profile facts (which refreshes the
+        session's precomputed eligibility) and returns the cached result.
+        """
+        # Validate/coerce first so a bad value never lands in the profile
+        facts = EligibilityInput(**{k: v for k, v in args.items() if k in EligibilityInput.model_fields})
+        for field, value in facts.model_dump(exclude_none=True).items():
+            memory.update_profile(field, value)
+        return memory.eligibility.get(scheme_id) if scheme_id else None
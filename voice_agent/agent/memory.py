@@ -1,17 +1,37 @@
 from typing import List, Dict, Any, Optional
 import json
 from ..utils.logger import logger
+from ..tools.eligibility import EligibilityCache
+from ..tools.definitions import EligibilityInput
 
 class MemoryManager:
+    # Profile values below this confidence are kept, but not treated as facts
+    # (eligibility, planner profile) until confirmed or restated
+    MIN_CONFIDENCE = 0.6
+
     def __init__(self):
         self.profile: Dict[str, Any] = {}
+        # Confidence per profile field (1.0 for stated/tool facts, lower for extracted ones)
+        self.profile_confidence: Dict[str, float] = {}
         self.history: List[Dict[str, Any]] = []
         self.conflicts: List[Dict[str, Any]] = []
+        # Eligibility precomputed from the profile, refreshed per changed field
+        self.eligibility = EligibilityCache()
 
-    def update_profile(self, key: str, value: Any):
-        """Updates user profile with conflict detection."""
+    def update_profile(self, key: str, value: Any, confidence: float = 1.0):
+        """
+        Updates user profile with conflict detection. A value never replaces a
+        different one that was recorded with higher confidence.
+        """
         existing = self.profile.get(key)
-        
+        old_confidence = self.profile_confidence.get(key, 0.0)
+        if key in self.profile and existing != value and confidence < old_confidence:
+            logger.info(
+                "Keeping %s=%s (confidence %.2f) over %s (confidence %.2f)",
+                key, existing, old_confidence, value, confidence,
+            )
+            return
+
         # Simple conflict check
         if existing and existing != value:
             # Ignore minor type diffs if values similar (e.g. 5 vs 5.0)
@@ -25,21 +45,44 @@ class MemoryManager:
                 # For now, overwrite but log. 
                 # Ideally, we pause and ask, but logic here is simple.
         
+        if existing == value:
+            confidence = max(confidence, old_confidence)
+        changed = existing != value or confidence != old_confidence
         self.profile[key] = value
-        logger.debug(f"Profile Updated: {key}={value}")
+        self.profile_confidence[key] = confidence
+        logger.debug("Profile Updated: %s=%s (confidence %.2f)", key, value, confidence)
+        if changed:
+            self.eligibility.on_profile_change(self.eligibility_input(), [key])
+
+    def confident_profile(self, min_confidence: float | None = None) -> Dict[str, Any]:
+        threshold = self.MIN_CONFIDENCE if min_confidence is None else min_confidence
+        return {
+            k: v for k, v in self.profile.items()
+            if self.profile_confidence.get(k, 1.0) >= threshold
+        }
+
+    def eligibility_input(self, min_confidence: float | None = None) -> EligibilityInput:
+        """Builds the eligibility tool input from sufficiently confident profile fields."""
+        return EligibilityCache.build_input(self.confident_profile(min_confidence))
 
     def add_turn(self, role: str, text: str):
         self.history.append({"role": role, "text": text})
 
     def get_context_block(self) -> str:
         """Returns specific context for the LLM"""
+        confident = self.confident_profile()
         return json.dumps({
-            "profile": self.profile,
+            "profile": confident,
+            # Low-confidence guesses the planner may confirm with the caller
+            "unconfirmed": {k: v for k, v in self.profile.items() if k not in confident},
             "recent_history": self.history[-5:], # Last 5 turns
+            "eligibility": self.eligibility.summary(),
             "known_conflicts": self.conflicts
         }, indent=2)
 
     def clear(self):
         self.profile = {}
+        self.profile_confidence = {}
         self.history = []
         self.conflicts = []
+        self.eligibility.clear()
@@ -1,10 +1,18 @@
 import os
 import json
-from groq import Groq
+import time
+import asyncio
+from dataclasses import dataclass, field
+from groq import AsyncGroq
+from openai import AsyncOpenAI
 from dotenv import load_dotenv
 
 from .schemas import PlannerOutput, AgentState
+from .stub_llm import StubLLMClient
 from ..utils.logger import logger
+from ..utils.admission import Overloaded, admission
+from ..utils.latency import LatencyTracker
+from ..utils.metrics import LLM_TOKENS, LLM_BACKEND_SECONDS, PLANNER_HEDGES
 
 load_dotenv()
 
@@ -44,6 +52,9 @@ INSTRUCTIONS FOR NORMAL USER INPUT:
 5. If the user is just asking a general question about schemes (explanations, documents, how to apply):
    - you can answer directly by setting "next_state" to "SPEAKING"
    - and using your own knowledge in "response_text_if_any" (no need to call tools every time).
+6. CONTEXT "eligibility" holds results already computed from the user's profile
+   (status per scheme id, with reasons or missing fields). If it answers the question, reply directly
+   with "next_state": "SPEAKING" instead of calling `check_eligibility` again.
 
 SPECIAL BEHAVIOUR FOR SUMMARY / FINAL ANSWER:
 - Sometimes you will be called again with CURRENT USER INPUT like "Summarize results" or similar,
@@ -66,48 +77,171 @@ OUTPUT FORMAT: Strict JSON matching PlannerOutput schema.
 }
 """
 
+# Compact protocol: same rules in far fewer tokens, and a short-key JSON answer
+# (mapped back to PlannerOutput by `expand_compact`).
+COMPACT_SYSTEM_PROMPT = """You plan turns for a Telugu government-welfare voice agent (Telangana/central schemes).
+Reply style: simple spoken Telugu, warm, 2-4 sentences, no English words unless unavoidable.
+Tools: check_eligibility(age,income,occupation,land_acres,caste,scheme_id); search_schemes(keywords,scheme_id).
+Scheme ids: rythu_bandhu, aasara_pension, kalyana_lakshmi.
+Rules:
+- Need facts (age, income, land) to decide? s=S and ask one clear question in r.
+- Enough facts for a tool? s=E with t.
+- General scheme questions: answer yourself, s=S.
+- CONTEXT.eligibility already answers it? s=S, no tools.
+- Input "Summarize results": s=S, no tools; explain suitability, eligibility, documents, next steps.
+Output ONLY short-key JSON:
+{"i":"check_eligibility|search|chitchat|summary","s":"E|S","t":[{"n":"tool","a":{}}],"r":"Telugu reply"%s}"""
+
+COMPACT_REASONING_KEY = ',"w":"brief reasoning"'
+COMPACT_STATES = {"E": AgentState.EXECUTING, "S": AgentState.SPEAKING}
+
+
+def expand_compact(data: dict) -> dict:
+    """Maps a short-key plan back to PlannerOutput fields (full keys pass through)."""
+    if "next_state" in data or "s" not in data:
+        return data
+    state = str(data.get("s", "S")).upper()
+    return {
+        "reasoning": data.get("w", ""),
+        "intent": data.get("i", "chitchat"),
+        "next_state": COMPACT_STATES.get(state[:1], state),
+        "tool_calls": [
+            {"tool_name": c.get("n", ""), "arguments": c.get("a") or {}}
+            for c in data.get("t") or []
+        ],
+        "response_text_if_any": data.get("r"),
+    }
+
+
+def compact_context(context: str) -> str:
+    """Re-serializes JSON context without indentation, escapes or empty fields."""
+    try:
+        data = json.loads(context)
+    except (ValueError, TypeError):
+        return context
+    if isinstance(data, dict):
+        data = {k: v for k, v in data.items() if v not in ({}, [], None, "")}
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+DEFAULT_MODEL = "llama-3.3-70b-versatile"
+DEFAULT_FALLBACK_MODEL = "llama-3.1-8b-instant"
+
+
+@dataclass
+class PlannerBackend:
+    """One LLM endpoint/model the planner can call, with its own latency history."""
+    name: str
+    client: object
+    model: str
+    latency: LatencyTracker = field(default_factory=LatencyTracker)
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() in ("1", "true", "on")
+
+
 class Planner:
-    def __init__(self):
-        api_key = os.getenv("GROQ_API_KEY")
+    def __init__(
+        self,
+        client=None,
+        protocol: str | None = None,
+        include_reasoning: bool | None = None,
+        fallback_client=None,
+    ):
+        # "compact" (default) or "verbose" (original long prompt and full-key JSON)
+        self.protocol = (protocol or os.getenv("PLANNER_PROTOCOL", "compact")).lower()
+        if include_reasoning is None:
+            include_reasoning = _env_flag("PLANNER_REASONING", "0")
+        self.include_reasoning = include_reasoning
+
+        # Hedging: if the primary has not answered by ~its p95 latency, race a fallback
+        self.hedge_quantile = float(os.getenv("PLANNER_HEDGE_QUANTILE", "0.95"))
+        self.hedge_initial_delay = float(os.getenv("PLANNER_HEDGE_DELAY", "1.5"))
+        self.hedge_min_delay = float(os.getenv("PLANNER_HEDGE_MIN_DELAY", "0.3"))
+        self.hedge_max_delay = float(os.getenv("PLANNER_HEDGE_MAX_DELAY", "4.0"))
+        self.hedge_min_samples = 10
+        self.timeout = 10.0
+
+        stub = os.getenv("PLANNER_BACKEND", "groq").lower() == "stub"
+        if client is None:
+            client = self._client_from_env("", stub)
+        self.primary = PlannerBackend("primary", client, os.getenv("PLANNER_MODEL", DEFAULT_MODEL))
+
+        self.fallback = None
+        if fallback_client is None and _env_flag("PLANNER_HEDGE", "1") and (stub or os.getenv("GROQ_API_KEY")):
+            fallback_client = self._client_from_env("PLANNER_FALLBACK_", stub)
+        if fallback_client is not None:
+            self.fallback = PlannerBackend(
+                "fallback", fallback_client, os.getenv("PLANNER_FALLBACK_MODEL", DEFAULT_FALLBACK_MODEL)
+            )
+
+    @staticmethod
+    def _client_from_env(prefix: str, stub: bool):
+        if stub:
+            logger.info("[INIT] Using offline stub planner backend")
+            return StubLLMClient()
+
+        api_key = os.getenv(f"{prefix}API_KEY") if prefix else None
+        api_key = api_key or os.getenv("GROQ_API_KEY")
         if not api_key:
             logger.critical("GROQ_API_KEY not found in environment!")
             raise ValueError("API Key missing")
 
-        self.client = Groq(api_key=api_key)
+        base_url = os.getenv(f"{prefix}BASE_URL" if prefix else "GROQ_BASE_URL") or None
+        if prefix and base_url:
+            # Any OpenAI-compatible server (".../v1"); AsyncGroq would post to {base_url}/openai/v1/...
+            return AsyncOpenAI(api_key=api_key, base_url=base_url, max_retries=0)
+        # AsyncGroq so a losing hedged request is really cancelled (no orphaned threads)
+        return AsyncGroq(api_key=api_key, base_url=base_url, max_retries=0 if prefix else 2)
 
-    async def plan(self, user_text: str, context: str) -> PlannerOutput:
-        logger.info("[PLANNING] Thinking...")
+    @property
+    def client(self):
+        return self.primary.client
+
+    @property
+    def compact(self) -> bool:
+        return self.protocol == "compact"
 
-        # Optimize context length for faster processing (keep last 5 turns max)
-        context_lines = context.split('\n')
-        if len(context_lines) > 20:
-            context = '\n'.join(context_lines[-20:])  # Keep last 20 lines
+    def hedge_delay(self) -> float:
+        """Primary's recent p95 (clamped); a fixed start value until enough samples exist."""
+        if len(self.primary.latency) < self.hedge_min_samples:
+            return self.hedge_initial_delay
+        observed = self.primary.latency.quantile(self.hedge_quantile)
+        return min(self.hedge_max_delay, max(self.hedge_min_delay, observed))
 
-        prompt = f"""CONTEXT:
+    def build_messages(self, user_text: str, context: str) -> list:
+        if self.compact:
+            system = COMPACT_SYSTEM_PROMPT % (COMPACT_REASONING_KEY if self.include_reasoning else "")
+            prompt = f'CONTEXT:{compact_context(context)}\nINPUT:"{user_text}"'
+        else:
+            # Optimize context length for faster processing (keep last 5 turns max)
+            context_lines = context.split('\n')
+            if len(context_lines) > 20:
+                context = '\n'.join(context_lines[-20:])  # Keep last 20 lines
+            system = SYSTEM_PROMPT
+            prompt = f"""CONTEXT:
 {context}
 
 CURRENT USER INPUT: "{user_text}"
 
 Generate JSON Plan:"""
+        return [
+            {"role": "system", "content": system},
+            {"role": "user", "content": prompt}
+        ]
+
+    async def plan(self, user_text: str, context: str) -> PlannerOutput:
+        logger.info("[PLANNING] Thinking...")
+        messages = self.build_messages(user_text, context)
 
         try:
             # Use async with timeout for faster failure handling
-            import asyncio
-            response = await asyncio.wait_for(
-                asyncio.to_thread(
-                    lambda: self.client.chat.completions.create(
-                        model="llama-3.3-70b-versatile",
-                        messages=[
-                            {"role": "system", "content": SYSTEM_PROMPT},
-                            {"role": "user", "content": prompt}
-                        ],
-                        temperature=0.2,
-                        response_format={"type": "json_object"},
-                        max_tokens=500  # Limit response size for speed
-                    )
-                ),
-                timeout=10.0  # 10 second timeout
-            )
+            async with admission.stage("llm"):
+                response = await asyncio.wait_for(
+                    self._hedged_complete(messages),
+                    timeout=self.timeout  # 10 second timeout
+                )
 
             content = response.choices[0].message.content
             # Clean markdown fences if present (just in case)
@@ -115,9 +249,15 @@ Generate JSON Plan:"""
                 content = content.replace("```json", "").replace("```", "").strip()
             
             data = json.loads(content)
+            usage = getattr(response, "usage", None)
+            if usage is not None:
+                LLM_TOKENS.inc(usage.prompt_tokens, kind="prompt")
+                LLM_TOKENS.inc(usage.completion_tokens, kind="completion")
 
-            return PlannerOutput(**data)
+            return PlannerOutput(**expand_compact(data))
 
+        except Overloaded:
+            raise  # the caller plays the hold prompt
         except Exception as e:
             logger.error(f"Planning failed: {e}")
             return PlannerOutput(
@@ -126,3 +266,62 @@ Generate JSON Plan:"""
                 next_state=AgentState.SPEAKING,
                 response_text_if_any="క్షమించండి, సాంకేతిక సమస్య ఉంది. దయచేసి మళ్ళీ చెప్పండి."
             )
+
+    async def _complete(self, backend: PlannerBackend, messages: list):
+        start = time.perf_counter()
+        try:
+            response = await backend.client.chat.completions.create(
+                model=backend.model,
+                messages=messages,
+                temperature=0.2,
+                response_format={"type": "json_object"},
+                max_tokens=300 if self.compact else 500  # Limit response size for speed
+            )
+        except asyncio.CancelledError:
+            # Lost a hedge race: the elapsed time is a lower bound, and leaving out
+            # the slow tail would drag the p95 (and so the hedge delay) down
+            self._record_latency(backend, time.perf_counter() - start)
+            raise
+        # Errors are not recorded: fast failures would shrink the hedge delay too
+        self._record_latency(backend, time.perf_counter() - start)
+        return response
+
+    @staticmethod
+    def _record_latency(backend: PlannerBackend, elapsed: float):
+        backend.latency.record(elapsed)
+        LLM_BACKEND_SECONDS.observe(elapsed, backend=backend.name)
+
+    async def _hedged_complete(self, messages: list):
+        """
+        Sends to the primary; if it has not answered within `hedge_delay()` (or
+        failed), also sends to the fallback and takes whichever answers first,
+        cancelling the other.
+        """
+        primary = asyncio.create_task(self._complete(self.primary, messages))
+        if self.fallback is None:
+            return await primary
+
+        hedge = None
+        try:
+            try:
+                return await asyncio.wait_for(asyncio.shield(primary), self.hedge_delay())
+            except asyncio.TimeoutError:
+                logger.info("[PLANNING] Primary slow, hedging to fallback model")
+            except Exception as e:
+                logger.warning(f"Primary planner failed, trying fallback: {e}")
+
+            hedge = asyncio.create_task(self._complete(self.fallback, messages))
+            racing = {primary, hedge}
+            while racing:
+                done, racing = await asyncio.wait(racing, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        PLANNER_HEDGES.inc(winner="primary" if task is primary else "fallback")
+                        return task.result()
+            PLANNER_HEDGES.inc(winner="none")
+            return primary.result()  # both failed: surface the primary's error
+        finally:
+            # Also runs on barge-in / overall timeout, so no request outlives the turn
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
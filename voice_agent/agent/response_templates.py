@@ -0,0 +1,113 @@
+from typing import Any, Dict, List, Optional
+
+from .schemas import PlanStep
+from ..tools.definitions import ToolOutput
+from ..tools.knowledge import SCHEMES_DB
+
+# Spoken next step shared by every scheme we currently know about
+APPLY_HINT = "దగ్గరలోని మీసేవా కేంద్రంలో గానీ, గ్రామ పంచాయతీ లేదా మున్సిపల్ కార్యాలయంలో గానీ దరఖాస్తు చేసుకోవచ్చు."
+MAX_SPOKEN_MATCHES = 3
+
+
+def _join(items: List[str]) -> str:
+    items = [str(i).strip() for i in items if str(i).strip()]
+    if len(items) <= 1:
+        return "".join(items)
+    return ", ".join(items[:-1]) + " మరియు " + items[-1]
+
+
+def _sentence(text: str) -> str:
+    text = text.strip()
+    if text and text[-1] not in ".?!।":
+        text += "."
+    return text
+
+
+class ResponseRenderer:
+    """
+    Turns tool results into natural spoken Telugu without another LLM call.
+
+    `render` returns None when a result has a shape it does not know, so the
+    caller can fall back to LLM summarization for the unusual cases.
+    """
+
+    def render(self, tool_calls: List[PlanStep], tool_results: List[ToolOutput]) -> Optional[str]:
+        parts = []
+        for index, result in enumerate(tool_results):
+            step = tool_calls[index] if index < len(tool_calls) else None
+            text = self._render_one(step, result)
+            if text is None:
+                return None
+            parts.append(text)
+        return " ".join(parts) if parts else None
+
+    def _render_one(self, step: Optional[PlanStep], result: ToolOutput) -> Optional[str]:
+        data = result.data or {}
+        tool_name = step.tool_name.lower() if step else ""
+        scheme_id = (step.arguments.get("scheme_id") if step else None) or ""
+        scheme = SCHEMES_DB.get(str(scheme_id).lower())
+
+        status = data.get("status")
+        if status == "ELIGIBLE":
+            return self.eligible(scheme, data)
+        if status == "INELIGIBLE":
+            return self.ineligible(scheme, data)
+        if status == "MISSING_INFO":
+            return self.missing_info(data.get("missing_fields", []))
+
+        if "matches" in data:
+            return self.matches(data["matches"])
+        if tool_name == "search_schemes" and "name" in data:
+            return self.scheme_details(data)
+        return None
+
+    def eligible(self, scheme: Optional[Dict[str, Any]], data: Dict[str, Any]) -> str:
+        if data.get("message"):
+            lines = [_sentence(data["message"])]
+        elif scheme:
+            lines = [f"మీ వివరాల ప్రకారం మీరు {scheme['name']} పథకానికి అర్హులు కావచ్చు."]
+        else:
+            lines = ["మీ వివరాల ప్రకారం మీరు ఈ పథకానికి అర్హులు కావచ్చు."]
+        if scheme:
+            lines.append(f"ప్రయోజనం: {_sentence(scheme['benefits'])}")
+            lines.append(f"దరఖాస్తుకు కావలసిన పత్రాలు: {_join(scheme['docs'])}.")
+        lines.append(APPLY_HINT)
+        return " ".join(lines)
+
+    def ineligible(self, scheme: Optional[Dict[str, Any]], data: Dict[str, Any]) -> str:
+        name = scheme["name"] if scheme else "ఈ"
+        lines = [f"క్షమించండి, మీరు చెప్పిన వివరాల ప్రకారం ప్రస్తుతం {name} పథకానికి అర్హత కనిపించడం లేదు."]
+        reasons = data.get("reasons") or []
+        if reasons:
+            lines.append("కారణం: " + " ".join(_sentence(r) for r in reasons))
+        lines.append("మీకు సరిపోయే ఇతర పథకాల గురించి కావాలంటే అడగండి.")
+        return " ".join(lines)
+
+    def missing_info(self, missing_fields: List[str]) -> str:
+        return (
+            "మీరు ఏ పథకానికి అర్హులా అనేది ఖచ్చితంగా చెప్పాలంటే "
+            f"మరిన్ని వివరాలు కావాలి. దయచేసి ఇవి చెప్పండి: {', '.join(missing_fields)}."
+        )
+
+    def scheme_details(self, scheme: Dict[str, Any]) -> str:
+        lines = [f"{scheme['name']}: {_sentence(scheme.get('description', ''))}"]
+        if scheme.get("benefits"):
+            lines.append(f"ప్రయోజనం: {_sentence(scheme['benefits'])}")
+        if scheme.get("eligibility_rules"):
+            lines.append(f"అర్హత: {_sentence(scheme['eligibility_rules'])}")
+        if scheme.get("docs"):
+            lines.append(f"కావలసిన పత్రాలు: {_join(scheme['docs'])}.")
+        lines.append(APPLY_HINT)
+        return " ".join(lines)
+
+    def matches(self, matches: List[Dict[str, Any]]) -> Optional[str]:
+        if not matches:
+            return None
+        if len(matches) == 1:
+            return self.scheme_details(matches[0])
+        spoken = matches[:MAX_SPOKEN_MATCHES]
+        lines = [f"మీ ప్రశ్నకు సరిపోయే పథకాలు: {_join([m['name'] for m in spoken])}."]
+        for m in spoken:
+            lines.append(f"{m['name']} – {_sentence(m.get('description', ''))}")
+        lines.append("వీటిలో ఏ పథకం గురించి ఇంకా వివరంగా తెలుసుకోవాలి?")
+        return " ".join(lines)
@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
+from ..tools.definitions import EligibilityInput
+
 class AgentState(str, Enum):
     START = "START"
     IDLE = "IDLE" 
@@ -18,7 +20,7 @@ class PlanStep(BaseModel):
     arguments: Dict[str, Any]
 
 class PlannerOutput(BaseModel):
-    reasoning: str
+    reasoning: str = "" # Optional: skipped by the compact planner protocol
     intent: str
     next_state: AgentState
     tool_calls: List[PlanStep] = []
@@ -29,3 +31,23 @@ class EvaluatorOutput(BaseModel):
     action: str  # SPEAK, ASK_USER, REPLAN, RETRY
     reason: str
     clean_response: str = "" # Final text to speak
+    needs_summary: bool = False # clean_response is raw tool data for the LLM, not speech
+
+class TurnProfile(EligibilityInput):
+    """Profile fields a channel may send with a turn; wrong types or unknown fields are a 422."""
+    model_config = ConfigDict(extra="forbid")
+
+class TurnRequest(BaseModel):
+    """POST /api/turn body (SMS / IVR text channels)."""
+    session_id: str = Field(..., min_length=1, max_length=128)
+    text: str = Field(..., min_length=1, max_length=2000)
+    # Optional known profile (e.g. from the channel's CRM) merged before planning
+    profile: TurnProfile = Field(default_factory=TurnProfile)
+
+class TurnResponse(BaseModel):
+    session_id: str
+    reply: str
+    intent: str
+    source: str
+    tools: List[str] = []
+    profile: Dict[str, Any] = {}
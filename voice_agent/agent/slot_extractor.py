@@ -0,0 +1,241 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from ..tools.knowledge import SCHEMES_DB
+
+TELUGU_DIGITS = str.maketrans("౦౧౨౩౪౫౬౭౮౯", "0123456789")
+
+UNITS = {
+    "ఒకటి": 1, "ఒక": 1, "ఒక్క": 1, "రెండు": 2, "మూడు": 3, "నాలుగు": 4, "ఐదు": 5,
+    "ఆరు": 6, "ఏడు": 7, "ఎనిమిది": 8, "తొమ్మిది": 9, "పది": 10, "పదకొండు": 11,
+    "పన్నెండు": 12, "పదిహేను": 15, "ఇరవై": 20, "ముప్పై": 30, "నలభై": 40, "యాభై": 50,
+    "అరవై": 60, "డెబ్బై": 70, "ఎనభై": 80, "తొంభై": 90, "వంద": 100, "అర": 0.5,
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7,
+    "eight": 8, "nine": 9, "ten": 10, "twenty": 20, "thirty": 30, "forty": 40,
+    "fifty": 50, "sixty": 60, "seventy": 70, "eighty": 80, "ninety": 90, "hundred": 100,
+    "half": 0.5,
+}
+# "రెండున్నర" = two and a half
+HALF_SUFFIX = "న్నర"
+
+MULTIPLIERS = {
+    "లక్ష": 100000, "లక్షలు": 100000, "లక్షల": 100000, "lakh": 100000, "lakhs": 100000, "lac": 100000,
+    "వేలు": 1000, "వేల": 1000, "వెయ్యి": 1000, "thousand": 1000, "k": 1000,
+}
+
+AGE_AFTER = ("ఏళ్లు", "ఏళ్ళు", "ఏళ్ల", "సంవత్సరాలు", "సంవత్సరాల", "years", "yrs", "year")
+AGE_BEFORE = ("వయస్సు", "వయసు", "age", "aged")
+# "67 years old"
+AGE_OLD = ("old",)
+# "నాకు 65 ఏళ్లు" / "I'm 65 years": a year count about the caller is their age (exact tokens)
+AGE_SELF = ("నాకు", "i'm", "im", "am")
+# "రెండు సంవత్సరాల నుండి", "2 years ago", "for 3 years": a duration, not an age
+DURATION_AFTER = ("నుండి", "నుంచి", "క్రితం", "కిందట", "తర్వాత", "ago", "back", "since")
+DURATION_BEFORE = ("గత", "for", "since", "last", "past")
+# "మా నాన్న వయస్సు 70": someone else's age
+OTHER_PERSON = (
+    "నాన్న", "అమ్మ", "తండ్రి", "తల్లి", "భార్య", "భర్త", "ఆయన", "ఆవిడ", "కొడుకు", "కూతురు",
+    "అబ్బాయి", "తాత", "అవ్వ", "father", "mother", "wife", "husband", "son", "daughter",
+)
+LAND_AFTER = ("ఎకరాలు", "ఎకరాల", "ఎకరం", "ఎకరా", "acres", "acre")
+INCOME_CUES = ("ఆదాయం", "ఆదాయము", "జీతం", "సంపాదన", "income", "salary", "రూపాయలు", "rupees", "rs", "₹")
+MONTHLY_CUES = ("నెలకు", "నెలసరి", "monthly", "month")
+
+OCCUPATIONS = {
+    "farmer": ("రైతు", "రైతుని", "వ్యవసాయం", "వ్యవసాయ", "farmer", "farming"),
+    "laborer": ("కూలీ", "కూలి", "labour", "laborer", "labourer"),
+    "weaver": ("నేత", "weaver"),
+    "student": ("విద్యార్థి", "student"),
+    "homemaker": ("గృహిణి", "housewife", "homemaker"),
+    "business": ("వ్యాపారం", "business", "shop"),
+    "employee": ("ఉద్యోగి", "ఉద్యోగం", "job", "employee"),
+}
+CASTES = {
+    "SC": ("ఎస్సీ", "దళిత", "sc"),
+    "ST": ("ఎస్టీ", "గిరిజన", "st"),
+    "BC": ("బీసీ", "bc"),
+    "OC": ("ఓసీ", "oc"),
+    "Minority": ("మైనారిటీ", "ముస్లిం", "minority", "muslim"),
+}
+# "st"/"oc" are also ordinary English tokens ("st student"); accept them only next to a caste word
+CONTEXT_ONLY_CUES = ("st", "oc")
+CASTE_CONTEXT = ("కుల", "caste", "category", "community", "సామాజిక")
+
+# ASCII digits only: \d also matches "²" and other digits float() rejects
+_TOKEN_RE = re.compile(r"₹|[0-9](?:[0-9,.]*[0-9])?|[^\s0-9.,?!।₹]+")
+_SCHEME_NAMES = sorted((s["name"] for s in SCHEMES_DB.values()), key=len, reverse=True)
+
+
+@dataclass
+class Slot:
+    field: str
+    value: object
+    confidence: float
+    text: str
+
+
+def _tokenize(text: str) -> List[str]:
+    text = text.translate(TELUGU_DIGITS).lower()
+    # Scheme names contain profile words ("రైతు బంధు"); drop them before matching
+    for name in _SCHEME_NAMES:
+        text = text.replace(name, " ")
+    return _TOKEN_RE.findall(text)
+
+
+def _word_value(token: str) -> Optional[float]:
+    if token in UNITS:
+        return UNITS[token]
+    if token.endswith(HALF_SUFFIX):
+        stem = token[: -len(HALF_SUFFIX)]
+        for word, value in UNITS.items():
+            # "రెండున్నర" drops the last vowel of "రెండు"
+            if word[:-1] and stem.startswith(word[:-1]) and len(stem) <= len(word):
+                return value + 0.5
+    return None
+
+
+def _digits_value(token: str) -> Optional[float]:
+    """Value of a digit token ("62", "1,50,000", "1.5"); None if malformed ("1.2.3")."""
+    try:
+        return float(token.replace(",", ""))
+    except ValueError:
+        return None
+
+
+def _number_at(tokens: List[str], i: int) -> Optional[Tuple[float, int]]:
+    """Plain number starting at token i ("62", "అరవై రెండు"): (value, next_token), or None."""
+    if i >= len(tokens):
+        return None
+    token = tokens[i]
+    if token[0] in "0123456789":
+        value = _digits_value(token)
+        return None if value is None else (value, i + 1)
+    value = _word_value(token)
+    if value is None:
+        return None
+    j = i + 1
+    # "అరవై రెండు" -> 62
+    while j < len(tokens):
+        nxt = _word_value(tokens[j])
+        if nxt is None or nxt >= 10 or value < 10:
+            break
+        value += nxt
+        j += 1
+    return value, j
+
+
+def _numbers(tokens: List[str]) -> List[Tuple[float, int, int, bool]]:
+    """
+    Finds number expressions. Returns (value, first_token, last_token, has_multiplier).
+    Handles "62", "1,50,000", "1.5 లక్షలు", "అరవై రెండు", "రెండున్నర ఎకరాలు", "10 వేలు",
+    "రెండు లక్షల యాభై వేలు".
+    """
+    found = []
+    i = 0
+    while i < len(tokens):
+        parsed = _number_at(tokens, i)
+        if parsed is None:
+            i += 1
+            continue
+        value, j = parsed
+
+        has_multiplier = False
+        if j < len(tokens) and tokens[j] in MULTIPLIERS:
+            scale = MULTIPLIERS[tokens[j]]
+            value *= scale
+            has_multiplier = True
+            j += 1
+            # "రెండు లక్షల యాభై వేలు" -> 250000: add terms while the multiplier shrinks
+            while (term := _number_at(tokens, j)) is not None:
+                term_value, k = term
+                if k >= len(tokens) or tokens[k] not in MULTIPLIERS or MULTIPLIERS[tokens[k]] >= scale:
+                    break
+                scale = MULTIPLIERS[tokens[k]]
+                value += term_value * scale
+                j = k + 1
+        found.append((value, i, j - 1, has_multiplier))
+        i = j
+    return found
+
+
+def _near(tokens: List[str], cues, start: int, end: int) -> bool:
+    return any(tokens[k].startswith(cues) for k in range(max(0, start), min(len(tokens), end)))
+
+
+def _has(tokens: List[str], words, start: int, end: int) -> bool:
+    return any(tokens[k] in words for k in range(max(0, start), min(len(tokens), end)))
+
+
+def _mentions(tokens: List[str], cues) -> bool:
+    for k, token in enumerate(tokens):
+        for cue in cues:
+            if token == cue or (len(cue) > 2 and token.startswith(cue)):
+                if cue in CONTEXT_ONLY_CUES and not _near(tokens, CASTE_CONTEXT, k - 2, k + 3):
+                    continue
+                return True
+    return False
+
+
+class SlotExtractor:
+    """
+    Rule-based profile extractor for Telugu and English utterances.
+
+    Finds age, annual income, land in acres, occupation and caste with a
+    confidence per slot, so the profile fills up without an LLM round trip.
+    """
+
+    def extract(self, text: str) -> List[Slot]:
+        tokens = _tokenize(text)
+        if not tokens:
+            return []
+        slots: Dict[str, Slot] = {}
+
+        def offer(slot: Slot):
+            current = slots.get(slot.field)
+            if current is None or slot.confidence > current.confidence:
+                slots[slot.field] = slot
+
+        for value, first, last, has_multiplier in _numbers(tokens):
+            span = " ".join(tokens[first:last + 1])
+            if _near(tokens, LAND_AFTER, last + 1, last + 2):
+                offer(Slot("land_acres", float(value), 0.9, span))
+                continue
+            if not has_multiplier and 0 < value < 120:
+                confidence = self._age_confidence(tokens, first, last)
+                if confidence is not None:
+                    offer(Slot("age", int(value), confidence, span))
+                    continue
+            income_cue = _near(tokens, INCOME_CUES, first - 3, first) or _near(tokens, INCOME_CUES, last + 1, last + 2)
+            if has_multiplier or income_cue:
+                monthly = _near(tokens, MONTHLY_CUES, first - 3, last + 3)
+                income = int(value * 12) if monthly else int(value)
+                confidence = 0.85 if income_cue else 0.6
+                offer(Slot("income", income, confidence - (0.1 if monthly else 0.0), span))
+
+        for field, table, confidence in (("occupation", OCCUPATIONS, 0.7), ("caste", CASTES, 0.8)):
+            for value, cues in table.items():
+                if _mentions(tokens, cues):
+                    offer(Slot(field, value, confidence, value))
+                    break
+
+        return list(slots.values())
+
+    @staticmethod
+    def _age_confidence(tokens: List[str], first: int, last: int) -> Optional[float]:
+        """
+        Confidence that the number at tokens[first:last+1] is the caller's age:
+        0.9 with an explicit age cue, 0.8 for a year count about the caller
+        ("నాకు 65 ఏళ్లు"), None otherwise. A bare year count is usually a
+        duration ("2 years ago") and is not taken as an age.
+        """
+        if _near(tokens, OTHER_PERSON, first - 3, first):
+            return None
+        years = _near(tokens, AGE_AFTER, last + 1, last + 2)
+        if _near(tokens, AGE_BEFORE, first - 2, first) or (years and _near(tokens, AGE_OLD, last + 2, last + 3)):
+            return 0.9
+        if not years:
+            return None
+        if _near(tokens, DURATION_AFTER, last + 2, last + 3) or _has(tokens, DURATION_BEFORE, first - 2, first):
+            return None
+        return 0.8 if _has(tokens, AGE_SELF, first - 2, first) else None
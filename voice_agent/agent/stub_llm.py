@@ -0,0 +1,113 @@
+import asyncio
+import json
+import re
+from types import SimpleNamespace
+
+from ..tools.knowledge import SCHEMES_DB
+
+_PIECE_RE = re.compile(r"[A-Za-z0-9_]+|[^\sA-Za-z0-9_]")
+
+
+def approx_tokens(text: str) -> int:
+    """
+    Rough Llama-3 style token count without the tokenizer: ASCII words cost
+    ~1 token per 4 characters, every other symbol (Telugu letters, escapes,
+    punctuation) about one token each.
+    """
+    count = 0
+    for piece in _PIECE_RE.findall(text):
+        count += (len(piece) + 3) // 4 if piece[0].isascii() and piece[0].isalnum() else 1
+    return count
+
+
+class StubLLMClient:
+    """
+    Offline stand-in for the AsyncGroq client (`await client.chat.completions.create`).
+
+    Returns a deterministic plan in whichever output format the system prompt
+    asks for, reports approximate token usage, and sleeps for a simulated
+    prefill + decode time so latency comparisons are meaningful.
+    `extra_delay` (seconds, or a callable returning seconds) injects tail latency.
+    """
+
+    def __init__(
+        self,
+        prefill_ms_per_token: float = 0.2,
+        decode_ms_per_token: float = 4.0,
+        base_ms: float = 40.0,
+        extra_delay=0.0,
+    ):
+        self.prefill_ms_per_token = prefill_ms_per_token
+        self.decode_ms_per_token = decode_ms_per_token
+        self.base_ms = base_ms
+        self.extra_delay = extra_delay
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+        self.calls = 0
+
+    def _plan(self, user_prompt: str) -> dict:
+        lowered = user_prompt.lower()
+        for scheme_id, scheme in SCHEMES_DB.items():
+            if scheme["name"] in user_prompt or scheme_id in lowered:
+                if "అర్హ" in user_prompt or "eligib" in lowered:
+                    return {
+                        "reasoning": "User asks about eligibility for a known scheme; run the eligibility tool.",
+                        "intent": "check_eligibility",
+                        "next_state": "EXECUTING",
+                        "tool_calls": [{"tool_name": "check_eligibility", "arguments": {"scheme_id": scheme_id}}],
+                    }
+                return {
+                    "reasoning": "User asks about a specific scheme; look up its details.",
+                    "intent": "search",
+                    "next_state": "EXECUTING",
+                    "tool_calls": [{"tool_name": "search_schemes", "arguments": {"scheme_id": scheme_id}}],
+                }
+        return {
+            "reasoning": "General question or small talk; answer directly in simple Telugu.",
+            "intent": "chitchat",
+            "next_state": "SPEAKING",
+            "response_text_if_any": "సరే, మీకు ఏ పథకం గురించి తెలుసుకోవాలో చెప్పండి. నేను సహాయం చేస్తాను.",
+        }
+
+    async def create(self, model: str, messages: list, max_tokens: int = 500, **kwargs):
+        content, usage, delay = self.respond(messages, max_tokens)
+        await asyncio.sleep(delay)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(**usage),
+        )
+
+    def respond(self, messages: list, max_tokens: int = 500) -> tuple[str, dict, float]:
+        """Returns (content, usage, simulated delay in seconds) for a chat request."""
+        self.calls += 1
+        system = next((m["content"] for m in messages if m["role"] == "system"), "")
+        user = next((m["content"] for m in reversed(messages) if m["role"] == "user"), "")
+        # Plan on the current utterance only, not on scheme names in the history
+        current = user.rsplit("INPUT:", 1)[-1]
+        plan = self._plan(current)
+
+        # Compact protocol prompts describe the short keys; answer in kind
+        if '"s":' in system:
+            out = {"i": plan["intent"], "s": plan["next_state"][0]}
+            if plan.get("tool_calls"):
+                out["t"] = [{"n": c["tool_name"], "a": c["arguments"]} for c in plan["tool_calls"]]
+            if plan.get("response_text_if_any"):
+                out["r"] = plan["response_text_if_any"]
+            if '"w":' in system:
+                out["w"] = plan["reasoning"]
+            content = json.dumps(out, ensure_ascii=False, separators=(",", ":"))
+        else:
+            plan.setdefault("tool_calls", [])
+            plan.setdefault("response_text_if_any", None)
+            content = json.dumps(plan, ensure_ascii=False, indent=2)
+
+        prompt_tokens = sum(approx_tokens(m["content"]) for m in messages)
+        completion_tokens = min(approx_tokens(content), max_tokens)
+        delay_ms = self.base_ms + prompt_tokens * self.prefill_ms_per_token + completion_tokens * self.decode_ms_per_token
+        extra = self.extra_delay() if callable(self.extra_delay) else self.extra_delay
+
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        return content, usage, delay_ms / 1000 + extra
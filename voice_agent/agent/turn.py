@@ -0,0 +1,101 @@
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, List, Optional
+
+from .evaluator import Evaluator
+from .executor import Executor
+from .memory import MemoryManager
+from .planner import Planner
+from .schemas import AgentState
+from .slot_extractor import SlotExtractor
+from ..utils.metrics import span, LLM_CALLS, RESPONSES
+
+ThoughtCallback = Callable[[str], Awaitable[None]]
+
+
+@dataclass
+class TurnResult:
+    reply: str
+    intent: str
+    source: str  # planner, template, llm_summary, ask_user, none
+    tools: List[str] = field(default_factory=list)
+
+
+class TurnRunner:
+    """
+    One user turn without audio: slot extraction, plan, tools, evaluation and
+    the reply text. Shared by the voice loop and the text API; the caller owns
+    the session memory and decides how to deliver the reply.
+    """
+
+    def __init__(self, planner: Optional[Planner] = None):
+        self.planner = planner or Planner()
+        self.executor = Executor()
+        self.evaluator = Evaluator()
+        self.slot_extractor = SlotExtractor()
+
+    async def run(self, memory: MemoryManager, user_text: str, on_thought: Optional[ThoughtCallback] = None) -> TurnResult:
+        async def thought(text: str):
+            if on_thought:
+                await on_thought(text)
+
+        memory.add_turn("user", user_text)
+
+        # Fill the profile locally (age, income, acres, occupation, caste) - no LLM call
+        with span("slots.extract"):
+            slots = self.slot_extractor.extract(user_text)
+        for slot in slots:
+            memory.update_profile(slot.field, slot.value, slot.confidence)
+        if slots:
+            await thought("Profile: " + ", ".join(f"{s.field}={s.value} ({s.confidence:.2f})" for s in slots))
+
+        # PLAN
+        context = memory.get_context_block()
+        await thought(f"Planning for: {user_text}")
+        LLM_CALLS.inc(purpose="plan")
+        with span("planner.plan"):
+            plan = await self.planner.plan(user_text, context)
+        await thought(f"Intent: {plan.intent}")
+
+        # ACT
+        reply, source, tools = "", "none", []
+        if plan.next_state == AgentState.SPEAKING:
+            reply = plan.response_text_if_any or "..."
+            source = "planner"
+
+        elif plan.next_state == AgentState.EXECUTING:
+            tool_results = []
+            for step in plan.tool_calls:
+                await thought(f"Executing: {step.tool_name}")
+                with span("executor.execute"):
+                    result = await self.executor.execute(step, memory)
+                tool_results.append(result)
+                tools.append(step.tool_name)
+                await thought(f"Result: {result.success}")
+
+            with span("evaluator.evaluate"):
+                evaluation = self.evaluator.evaluate(plan, tool_results, context)
+
+            if evaluation.action == "SYNTHESIZE":
+                # Quick Synthesis - use the evaluator's templated Telugu reply when it has one
+                if not evaluation.needs_summary:
+                    await thought("Rendering templated response...")
+                    reply = evaluation.clean_response
+                    source = "template"
+                else:
+                    # Unusual result shape: summarize with the planner (second LLM call)
+                    await thought("Synthesizing response...")
+                    source = "llm_summary"
+                    LLM_CALLS.inc(purpose="summarize")
+                    result_context = f"User asked: {user_text}. Tool results: {evaluation.clean_response}"
+                    with span("planner.plan"):
+                        final_plan = await self.planner.plan("Summarize results in simple Telugu", result_context)
+                    reply = final_plan.response_text_if_any or evaluation.clean_response or "సమాచారం సిద్ధంగా ఉంది."
+
+            elif evaluation.action == "ASK_USER":
+                reply = evaluation.clean_response
+                source = "ask_user"
+
+        if reply:
+            RESPONSES.inc(source=source)
+            memory.add_turn("agent", reply)
+        return TurnResult(reply=reply, intent=plan.intent, source=source, tools=tools)
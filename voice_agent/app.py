@@ -3,15 +3,17 @@ import json
 import os
 import sys
 import uvicorn
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import PlainTextResponse
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from voice_agent.server.agent_service import AgentService
 from voice_agent.server.state_manager import StateManager
+from voice_agent.server.static_assets import StaticAssetCache
+from voice_agent.server.text_service import router as text_api
 from voice_agent.utils.logger import logger
+from voice_agent.utils.metrics import registry as metrics_registry
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -22,15 +24,17 @@ app = FastAPI()
 # where you run the app from (project root or inside package)
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 STATIC_DIR = os.path.join(BASE_DIR, "static")
-INDEX_PATH = os.path.join(STATIC_DIR, "index.html")
 
-# Mount Static Files
-app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
+# Dashboard files are read and compressed once; served from memory with ETags
+static_assets = StaticAssetCache(STATIC_DIR)
 
 # Initialize Agent Service
 agent_service = AgentService()
 state_manager = StateManager()
 
+# Stateless text turns for SMS / IVR: POST /api/turn
+app.include_router(text_api)
+
 @app.on_event("startup")
 async def startup_event():
     logger.info("Starting Agent Service...")
@@ -41,16 +45,27 @@ async def shutdown_event():
     logger.info("Stopping Agent Service...")
     await agent_service.stop()
 
-@app.get("/")
-async def get():
+@app.api_route("/", methods=["GET", "HEAD"])
+async def get(request: Request):
     # Serve the dashboard HTML
-    with open(INDEX_PATH, "r", encoding="utf-8") as f:
-        return HTMLResponse(content=f.read())
+    return static_assets.response(request, "index.html")
+
+@app.api_route("/static/{path:path}", methods=["GET", "HEAD"])
+async def static_file(request: Request, path: str):
+    return static_assets.response(request, path)
+
+@app.get("/metrics")
+async def metrics():
+    # Prometheus scrape endpoint (text exposition format)
+    return PlainTextResponse(
+        content=metrics_registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
-    state_manager.websockets.append(websocket)
+    state_manager.add_websocket(websocket)
     try:
         # Send initial state
         await websocket.send_json({"type": "status", "payload": state_manager.status})
@@ -72,8 +87,11 @@ async def websocket_endpoint(websocket: WebSocket):
                 text = (data.get("payload") or "").strip()
                 if text:
                     await state_manager.add_text_input(text)
+            elif msg_type == "playback_done":
+                # Browser finished playing a streamed TTS utterance
+                state_manager.mark_playback_done(str(data.get("payload") or ""))
     except WebSocketDisconnect:
-        state_manager.websockets.remove(websocket)
+        state_manager.remove_websocket(websocket)
 
 def start():
     logger.info("Starting Web Server at http://localhost:8001")
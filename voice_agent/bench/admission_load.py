@@ -0,0 +1,120 @@
+"""
+Call-spike simulation for admission control.
+
+Each session runs turns through three simulated backends that degrade like
+the real ones when oversubscribed (processor sharing: every extra request
+beyond capacity slows all of them down):
+
+  asr  Whisper on a 2-core CPU              0.6 s per decode
+  llm  planner API, ~8 requests in parallel  0.5 s, client timeout 3 s
+  tts  edge-tts, ~8 streams in parallel      0.3 s
+
+Without admission every arriving turn piles in; with it, the real
+StageLimiter (utils/admission.py) caps each stage and sheds the rest, which
+get the cached hold prompt instead.
+
+Usage:
+    python -m voice_agent.bench.admission_load [--sessions 60] [--ramp 2.0] [--turns 3] [--slo 5]
+"""
+import argparse
+import asyncio
+import logging
+import random
+import time
+
+from ..utils.admission import DEFAULT_LIMITS, Overloaded, StageLimiter
+from ..utils.latency import LatencyTracker
+
+TICK = 0.005
+LLM_TIMEOUT = 3.0
+
+
+class SharedBackend:
+    """Processor-sharing server: `capacity` requests run at full speed, more share it."""
+
+    def __init__(self, capacity: int, service_time: float):
+        self.capacity = capacity
+        self.service_time = service_time
+        self.active = 0
+
+    async def call(self):
+        self.active += 1
+        try:
+            remaining = self.service_time
+            while remaining > 0:
+                await asyncio.sleep(TICK)
+                remaining -= TICK * min(1.0, self.capacity / self.active)
+        finally:
+            self.active -= 1
+
+
+class Pipeline:
+    def __init__(self, admission: bool):
+        self.backends = {
+            "asr": SharedBackend(2, 0.6),
+            "llm": SharedBackend(8, 0.5),
+            "tts": SharedBackend(8, 0.3),
+        }
+        self.limiters = {name: StageLimiter(name, *limits) for name, limits in DEFAULT_LIMITS.items()} if admission else {}
+
+    async def stage(self, name: str):
+        limiter = self.limiters.get(name)
+        if limiter is None:
+            await self.backends[name].call()
+            return
+        async with limiter.slot():
+            await self.backends[name].call()
+
+    async def turn(self):
+        await self.stage("asr")
+        await asyncio.wait_for(self.stage("llm"), LLM_TIMEOUT)
+        await self.stage("tts")
+
+
+async def session(pipeline: Pipeline, delay: float, turns: int, stats: dict, latencies: LatencyTracker):
+    await asyncio.sleep(delay)
+    for _ in range(turns):
+        start = time.perf_counter()
+        try:
+            await pipeline.turn()
+            latencies.record(time.perf_counter() - start)
+            stats["ok"] += 1
+        except Overloaded:
+            stats["shed"] += 1
+        except asyncio.TimeoutError:
+            stats["timeout"] += 1
+        await asyncio.sleep(1.0)  # caller listens to the reply / thinks
+
+
+async def run_mode(admission: bool, sessions: int, ramp: float, turns: int):
+    rng = random.Random(3)
+    pipeline = Pipeline(admission)
+    stats = {"ok": 0, "shed": 0, "timeout": 0}
+    latencies = LatencyTracker(window=sessions * turns)
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        session(pipeline, rng.uniform(0, ramp), turns, stats, latencies) for _ in range(sessions)
+    ))
+    return stats, latencies, time.perf_counter() - start
+
+
+async def run(sessions: int, ramp: float, turns: int, slo: float):
+    logging.getLogger("VoiceAgent").setLevel(logging.ERROR)
+    print(f"{sessions} sessions arriving over {ramp:.1f}s, {turns} turns each")
+    print(f"{'mode':<12}{'ok':>6}{f'<{slo:g}s':>6}{'shed':>6}{'timeout':>9}{'p50 s':>8}{'p99 s':>8}{'wall s':>8}")
+    for name, enabled in (("unlimited", False), ("admission", True)):
+        stats, lat, wall = await run_mode(enabled, sessions, ramp, turns)
+        p50 = lat.quantile(0.5) or 0.0
+        p99 = lat.quantile(0.99) or 0.0
+        within = sum(1 for x in lat.samples if x <= slo)
+        print(f"{name:<12}{stats['ok']:>6}{within:>6}{stats['shed']:>6}{stats['timeout']:>9}{p50:>8.2f}{p99:>8.2f}{wall:>8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=60)
+    parser.add_argument("--ramp", type=float, default=2.0)
+    parser.add_argument("--turns", type=int, default=3)
+    parser.add_argument("--slo", type=float, default=5.0, help="turn latency a caller will wait for")
+    args = parser.parse_args()
+    asyncio.run(run(args.sessions, args.ramp, args.turns, args.slo))
@@ -0,0 +1,68 @@
+"""
+Replays recorded Whisper word hypotheses through the lexicon rescorer and
+compares confirmation rate and word accuracy with the old whole-sentence rule
+(`language_probability * telugu_char_ratio < 0.7`).
+
+Replay file: JSONL, one utterance per line:
+    {"reference": "...", "language_probability": 0.9, "words": [["word", prob], ...]}
+
+Usage:
+    python -m voice_agent.bench.asr_rescoring [replay.jsonl]
+
+The bundled data/asr_replay_synthetic.jsonl only shows the format; use a replay
+set dumped from real calls for numbers worth quoting.
+"""
+import json
+import os
+import sys
+
+from ..utils.asr_rescoring import LexiconRescorer, WordHypothesis
+
+DEFAULT_REPLAY = os.path.join(os.path.dirname(__file__), "data", "asr_replay_synthetic.jsonl")
+
+
+def old_quality(text: str, language_probability: float) -> float:
+    telugu_chars = [ch for ch in text if "\u0c00" <= ch <= "\u0c7f"]
+    ratio = len(telugu_chars) / max(len(text), 1)
+    return language_probability * ratio
+
+
+def word_accuracy(hypothesis: str, reference: str) -> float:
+    ref = reference.split()
+    hyp = hypothesis.split()
+    hits = sum(1 for h, r in zip(hyp, ref) if h == r)
+    return hits / max(len(ref), 1)
+
+
+def run(path: str):
+    rescorer = LexiconRescorer()
+    rows = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                rows.append(json.loads(line))
+
+    old_confirms = new_confirms = 0
+    old_acc = new_acc = 0.0
+    for row in rows:
+        words = [WordHypothesis(text=w, probability=p) for w, p in row["words"]]
+        raw_text = " ".join(w for w, _ in row["words"])
+        lang_prob = row.get("language_probability", 1.0)
+
+        if old_quality(raw_text, lang_prob) < 0.7:
+            old_confirms += 1
+        result = rescorer.rescore(words, language_probability=lang_prob)
+        if result.needs_confirmation:
+            new_confirms += 1
+
+        old_acc += word_accuracy(raw_text, row["reference"])
+        new_acc += word_accuracy(result.text, row["reference"])
+
+    n = max(len(rows), 1)
+    print(f"utterances:            {len(rows)}")
+    print(f"confirmation rate:     old {old_confirms / n:.0%}  ->  rescored {new_confirms / n:.0%}")
+    print(f"word accuracy:         old {old_acc / n:.0%}  ->  rescored {new_acc / n:.0%}")
+
+
+if __name__ == "__main__":
+    run(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_REPLAY)
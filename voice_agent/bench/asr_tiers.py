@@ -0,0 +1,98 @@
+"""
+Replays recorded utterances through the ASR tier policies (CPU, int8) and
+compares throughput and word accuracy: always-small, always-tiny and adaptive
+(tiny first for short/busy turns, small re-decode on low quality).
+
+Replay set: a JSONL manifest, one utterance per line, audio paths relative to it:
+    {"audio": "clips/0001.wav", "reference": "..."}
+Audio must be 16 kHz mono WAV (int16 or float).
+
+Usage:
+    python -m voice_agent.bench.asr_tiers manifest.jsonl [--concurrency 1]
+
+--concurrency N decodes N utterances at once, so the queue-depth rule kicks in.
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import scipy.io.wavfile as wav
+from faster_whisper import WhisperModel
+
+from ..utils.asr_rescoring import LexiconRescorer
+from ..utils.asr_tiers import TIERS, AsrTierPolicy, TieredTranscriber
+from ..utils.metrics import ASR_DECODES
+from .asr_rescoring import word_accuracy
+
+SAMPLE_RATE = 16000
+
+
+def load_replay(path: str):
+    base = os.path.dirname(os.path.abspath(path))
+    rows = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            rate, audio = wav.read(os.path.join(base, row["audio"]))
+            if rate != SAMPLE_RATE:
+                raise ValueError(f"{row['audio']}: expected {SAMPLE_RATE} Hz, got {rate}")
+            if audio.dtype == np.int16:
+                audio = audio.astype("float32") / 32768.0
+            rows.append((audio.reshape(-1).astype("float32"), row["reference"]))
+    return rows
+
+
+def run_policy(mode: str, models: dict, rows, concurrency: int):
+    policy = AsrTierPolicy(mode=mode)
+    transcriber = TieredTranscriber(
+        {t: models[t] for t in policy.required_tiers()}, policy, LexiconRescorer(), sample_rate=SAMPLE_RATE
+    )
+    decodes_before = {t: ASR_DECODES.total(tier=t) for t in TIERS}
+    redecodes_before = ASR_DECODES.total(reason="redecode")
+
+    def one(row):
+        audio, reference = row
+        result = transcriber.transcribe(audio)
+        return result, word_accuracy(result.text, reference)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(one, rows))
+    wall = time.perf_counter() - start
+
+    audio_seconds = sum(len(a) for a, _ in rows) / SAMPLE_RATE
+    accuracy = sum(acc for _, acc in outcomes) / max(len(outcomes), 1)
+    return {
+        "wall": wall,
+        "speed": audio_seconds / wall,
+        "accuracy": accuracy,
+        "decodes": {t: ASR_DECODES.total(tier=t) - decodes_before[t] for t in TIERS},
+        "redecodes": ASR_DECODES.total(reason="redecode") - redecodes_before,
+    }
+
+
+def run(manifest: str, concurrency: int):
+    rows = load_replay(manifest)
+    models = {t: WhisperModel(t, device="cpu", compute_type="int8") for t in TIERS}
+    print(f"utterances: {len(rows)}, concurrency: {concurrency}")
+    print(f"{'policy':<10}{'wall s':>8}{'x realtime':>12}{'word acc':>10}   decodes per tier")
+    for mode in ("small", "tiny", "adaptive"):
+        r = run_policy(mode, models, rows, concurrency)
+        tiers = ", ".join(f"{t} {n:.0f}" for t, n in r["decodes"].items() if n)
+        print(
+            f"{mode:<10}{r['wall']:>8.1f}{r['speed']:>12.1f}{r['accuracy']:>10.0%}   "
+            f"{tiers} ({r['redecodes']:.0f} re-decodes)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("manifest")
+    parser.add_argument("--concurrency", type=int, default=1)
+    args = parser.parse_args()
+    run(args.manifest, args.concurrency)
@@ -0,0 +1,55 @@
+"""
+Replays scripted conversations (profile facts arriving turn by turn, then
+eligibility questions) and compares rule evaluations and tool calls for
+on-demand checks versus the per-session precomputed eligibility cache.
+
+Usage:
+    python -m voice_agent.bench.eligibility_cache
+"""
+import asyncio
+
+from ..agent.executor import Executor
+from ..agent.memory import MemoryManager
+from ..agent.schemas import PlanStep
+from ..tools.eligibility import EligibilityEngine
+from ..utils.metrics import RULE_EVALUATIONS, TOOL_CALLS
+
+# Each conversation: profile updates in the order the caller mentions them,
+# then the scheme ids the caller asks about.
+CONVERSATIONS = [
+    ([("age", 63), ("income", 90000)], ["aasara_pension", "rythu_bandhu"]),
+    ([("land_acres", 4.0), ("age", 45), ("income", 150000)], ["rythu_bandhu", "aasara_pension"]),
+    ([("age", 58), ("income", 250000), ("income", 140000)], ["aasara_pension"]),
+    ([("land_acres", 0.0)], ["rythu_bandhu", "aasara_pension"]),
+]
+
+
+async def run():
+    engine_scheme_count = len(EligibilityEngine().scheme_ids())
+
+    # On demand: every question is a planner round trip plus a tool call that runs the rule
+    asked = sum(len(questions) for _, questions in CONVERSATIONS)
+    recompute_all_evals = sum(len(updates) * engine_scheme_count for updates, _ in CONVERSATIONS)
+
+    executor = Executor()
+    for updates, questions in CONVERSATIONS:
+        memory = MemoryManager()
+        for field, value in updates:
+            memory.update_profile(field, value)
+        for scheme_id in questions:
+            await executor.execute(PlanStep(tool_name="check_eligibility", arguments={"scheme_id": scheme_id}), memory)
+
+    precompute_evals = RULE_EVALUATIONS.total()
+    served_from_cache = TOOL_CALLS.total(source="cache")
+
+    print(f"conversations:                    {len(CONVERSATIONS)}")
+    print(f"eligibility questions:            {asked}")
+    print(f"rule evals, recompute-all:        {recompute_all_evals}")
+    print(f"rule evals, dependency-tracked:   {int(precompute_evals)}")
+    print(f"questions answered from cache:    {int(served_from_cache)}/{asked}")
+    print("With results in the planner context, a question the cache covers can be answered in the")
+    print("planning call itself: no check_eligibility tool call and no follow-up summary call.")
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
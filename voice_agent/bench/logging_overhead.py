@@ -0,0 +1,121 @@
+"""
+Measures how long logging blocks the event loop with many concurrent sessions:
+the old synchronous colored StreamHandler vs the queued background JSON writer.
+
+Each simulated session logs a turn's worth of lines (transcript, plan, tool
+call, reply) between short awaits. Reported per mode:
+  - time spent inside logger calls on the loop thread (total and p99 per call)
+  - event-loop lag: how late a 1 ms ticker wakes up (p99 / max)
+
+--sink-ms adds a per-write delay to the output stream, like a slow terminal
+or a log pipe under backpressure.
+
+Usage:
+    python -m voice_agent.bench.logging_overhead [--sessions 50] [--turns 20] [--sink-ms 0.2]
+"""
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+
+from ..utils.logger import BackgroundWriter, ColoredFormatter, JsonFormatter, QueueingHandler, new_session_id, new_turn_id
+from ..utils.latency import LatencyTracker
+
+TRANSCRIPT = "నా వయస్సు 63 సంవత్సరాలు, ఆదాయం 90 వేలు. ఆసరా పెన్షన్ కి నేను అర్హుడినా?"
+REPLY = "మీ వివరాల ప్రకారం మీరు ఆసరా పెన్షన్ పథకానికి అర్హులు కావచ్చు. " * 3
+
+
+class SlowStream:
+    """File stream whose every write stalls for `delay` seconds."""
+
+    def __init__(self, stream, delay: float):
+        self.stream = stream
+        self.delay = delay
+
+    def write(self, text):
+        if self.delay:
+            time.sleep(self.delay)
+        return self.stream.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def make_logger(mode: str, stream):
+    logger = logging.getLogger(f"bench.logging.{mode}")
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    if mode == "sync":
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(ColoredFormatter("%(asctime)s - [%(levelname)s] - %(message)s", datefmt="%H:%M:%S"))
+        logger.addHandler(handler)
+        return logger, None
+    writer = BackgroundWriter(stream, JsonFormatter())
+    logger.addHandler(QueueingHandler(writer))
+    return logger, writer
+
+
+async def session(logger, turns: int, calls: LatencyTracker):
+    new_session_id()
+
+    def log(level, msg, *args, **kwargs):
+        start = time.perf_counter()
+        logger.log(level, msg, *args, **kwargs)
+        calls.record(time.perf_counter() - start)
+
+    for _ in range(turns):
+        new_turn_id()
+        log(logging.INFO, "[USER][Whisper] text=%r (tier=%s, quality=%.2f)", TRANSCRIPT, "small", 0.91,
+            extra={"fields": {"transcript": TRANSCRIPT}})
+        log(logging.DEBUG, "Profile Updated: %s=%s", "age", 63)
+        await asyncio.sleep(0.002)
+        log(logging.INFO, "[PLANNING] Thinking...")
+        await asyncio.sleep(0.005)
+        log(logging.INFO, "[EXECUTING] %s with %s", "check_eligibility", {"scheme_id": "aasara_pension"})
+        await asyncio.sleep(0.002)
+        log(logging.INFO, "[AGENT]: %s", REPLY)
+        await asyncio.sleep(0.005)
+
+
+async def ticker(stop: asyncio.Event, lag: LatencyTracker):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lag.record(time.perf_counter() - start - 0.001)
+
+
+async def run_mode(mode: str, sessions: int, turns: int, sink_delay: float):
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as f:
+        logger, writer = make_logger(mode, SlowStream(f, sink_delay))
+        calls = LatencyTracker(window=sessions * turns * 5)
+        lag = LatencyTracker(window=100000)
+        stop = asyncio.Event()
+        tick = asyncio.create_task(ticker(stop, lag))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(session(logger, turns, calls) for _ in range(sessions)))
+        wall = time.perf_counter() - start
+        stop.set()
+        await tick
+        if writer:
+            writer.close(timeout=30)
+        return wall, sum(calls.samples), calls.quantile(0.99), lag.quantile(0.99), lag.quantile(1.0)
+
+
+async def run(sessions: int, turns: int, sink_ms: float):
+    print(f"{sessions} sessions x {turns} turns, sink write delay {sink_ms} ms")
+    print(f"{'mode':<8}{'wall s':>8}{'in logger ms':>14}{'p99 call us':>13}{'loop lag p99 ms':>17}{'max ms':>8}")
+    for mode in ("sync", "queued"):
+        wall, total, p99_call, lag_p99, lag_max = await run_mode(mode, sessions, turns, sink_ms / 1000)
+        print(f"{mode:<8}{wall:>8.2f}{total * 1000:>14.1f}{p99_call * 1e6:>13.0f}{lag_p99 * 1000:>17.2f}{lag_max * 1000:>8.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--sink-ms", type=float, default=0.2)
+    args = parser.parse_args()
+    asyncio.run(run(args.sessions, args.turns, args.sink_ms))
@@ -0,0 +1,89 @@
+"""
+Measures planner latency percentiles with and without hedging, over HTTP,
+against two local stub LLM servers:
+
+  primary   the big model; usually fast, but `--tail` of requests stall 2-6 s
+  fallback  the small model; a bit slower on average but never stalls
+
+Both runs see the same stall pattern (seeded), so the difference is the hedge.
+
+Usage:
+    python -m voice_agent.bench.planner_hedging [--turns 100] [--tail 0.08]
+"""
+import argparse
+import asyncio
+import logging
+import random
+import time
+
+from groq import AsyncGroq
+from openai import AsyncOpenAI
+
+from ..agent.planner import Planner
+from ..utils.latency import LatencyTracker
+from ..utils.metrics import PLANNER_HEDGES
+from .stub_llm_server import start_in_background
+
+UTTERANCES = [
+    "ఆసరా పెన్షన్ కి నేను అర్హుడినా?",
+    "రైతు బంధు గురించి చెప్పండి",
+    "కళ్యాణ లక్ష్మి కి ఏ పత్రాలు కావాలి?",
+    "నమస్కారం",
+]
+CONTEXT = "PROFILE: {'age': 63, 'income': 90000}\nHISTORY:\nuser: నమస్కారం"
+
+
+def stall_pattern(seed: int, tail: float):
+    rng = random.Random(seed)
+
+    def extra():
+        return rng.uniform(2.0, 6.0) if rng.random() < tail else rng.uniform(0.0, 0.15)
+    return extra
+
+
+async def run_once(turns: int, tail: float, hedge: bool) -> LatencyTracker:
+    primary = start_in_background(extra_delay=stall_pattern(7, tail))
+    fallback = start_in_background(extra_delay=lambda: 0.15)
+    try:
+        planner = Planner(
+            client=AsyncGroq(api_key="stub", base_url=f"http://127.0.0.1:{primary.server_port}", max_retries=0),
+            # A non-Groq endpoint, as with PLANNER_FALLBACK_BASE_URL
+            fallback_client=AsyncOpenAI(
+                api_key="stub", base_url=f"http://127.0.0.1:{fallback.server_port}/v1", max_retries=0
+            ) if hedge else None,
+        )
+        if not hedge:
+            planner.fallback = None
+        latencies = LatencyTracker(window=turns)
+        for i in range(turns):
+            start = time.perf_counter()
+            plan = await planner.plan(UTTERANCES[i % len(UTTERANCES)], CONTEXT)
+            latencies.record(time.perf_counter() - start)
+            if plan.intent == "failure_recovery":
+                print(f"turn {i}: planner failed")
+        return latencies
+    finally:
+        primary.shutdown()
+        fallback.shutdown()
+
+
+async def run(turns: int, tail: float):
+    logging.getLogger("VoiceAgent").setLevel(logging.WARNING)
+    print(f"{turns} turns, primary stall rate {tail:.0%}")
+    print(f"{'mode':<12}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, hedge in (("no hedge", False), ("hedged", True)):
+        lat = await run_once(turns, tail, hedge)
+        row = [lat.quantile(q) * 1000 for q in (0.5, 0.95, 0.99, 1.0)]
+        print(f"{name:<12}" + "".join(f"{v:>10.0f}" for v in row))
+    print(
+        f"hedges won by fallback: {PLANNER_HEDGES.value(winner='fallback'):.0f}, "
+        f"by primary: {PLANNER_HEDGES.value(winner='primary'):.0f}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--turns", type=int, default=100)
+    parser.add_argument("--tail", type=float, default=0.08)
+    args = parser.parse_args()
+    asyncio.run(run(args.turns, args.tail))
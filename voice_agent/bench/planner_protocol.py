@@ -0,0 +1,67 @@
+"""
+Compares the verbose planner protocol (long prose prompt, indented context,
+full-key JSON with reasoning) with the compact one (minimized prompt, compact
+context, short-key JSON, reasoning optional) on the offline stub backend.
+
+Token counts are approximate (see stub_llm.approx_tokens); latency is the stub's
+simulated prefill + decode time, so the comparison reflects token volume.
+
+Usage:
+    python -m voice_agent.bench.planner_protocol
+"""
+import asyncio
+import time
+
+from ..agent.memory import MemoryManager
+from ..agent.planner import Planner
+from ..agent.stub_llm import StubLLMClient, approx_tokens
+
+TURNS = [
+    "నమస్కారం",
+    "నా వయస్సు 63 సంవత్సరాలు, ఆదాయం 90 వేలు",
+    "ఆసరా పెన్షన్ కి నేను అర్హుడినా?",
+    "రైతు బంధు గురించి చెప్పండి",
+    "కళ్యాణ లక్ష్మి కి ఏ పత్రాలు కావాలి?",
+    "సరే, ధన్యవాదాలు",
+]
+
+
+async def run_protocol(protocol: str, include_reasoning: bool = False):
+    client = StubLLMClient()
+    planner = Planner(client=client, protocol=protocol, include_reasoning=include_reasoning)
+    memory = MemoryManager()
+    memory.update_profile("age", 63)
+    memory.update_profile("income", 90000)
+
+    prompt_tokens = completion_tokens = 0
+    elapsed = 0.0
+    for text in TURNS:
+        memory.add_turn("user", text)
+        messages = planner.build_messages(text, memory.get_context_block())
+        prompt_tokens += sum(approx_tokens(m["content"]) for m in messages)
+
+        start = time.perf_counter()
+        plan = await planner.plan(text, memory.get_context_block())
+        elapsed += time.perf_counter() - start
+
+        reply, _, _ = client.respond(messages)
+        completion_tokens += approx_tokens(reply)
+        memory.add_turn("agent", plan.response_text_if_any or plan.intent)
+
+    n = len(TURNS)
+    return prompt_tokens / n, completion_tokens / n, elapsed / n * 1000
+
+
+async def run():
+    rows = [
+        ("verbose", *await run_protocol("verbose")),
+        ("compact + reasoning", *await run_protocol("compact", include_reasoning=True)),
+        ("compact", *await run_protocol("compact")),
+    ]
+    print(f"{'protocol':<22}{'prompt tok':>12}{'output tok':>12}{'latency ms':>12}")
+    for name, prompt, completion, latency in rows:
+        print(f"{name:<22}{prompt:>12.0f}{completion:>12.0f}{latency:>12.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
@@ -0,0 +1,60 @@
+"""
+Accuracy and latency of the local slot extractor on a labeled utterance set.
+
+Labeled file: JSONL, {"text": "...", "slots": {"age": 62, "income": 150000, ...}}
+
+Usage:
+    python -m voice_agent.bench.slot_extraction [labeled.jsonl]
+"""
+import json
+import os
+import sys
+import time
+
+from ..agent.slot_extractor import SlotExtractor
+
+DEFAULT_SET = os.path.join(os.path.dirname(__file__), "data", "slot_utterances.jsonl")
+
+
+def run(path: str, repeats: int = 200):
+    with open(path, encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f if line.strip()]
+
+    extractor = SlotExtractor()
+    true_pos = false_pos = false_neg = 0
+    exact = 0
+    timings = []
+
+    for row in rows:
+        expected = row["slots"]
+        start = time.perf_counter()
+        for _ in range(repeats):
+            slots = extractor.extract(row["text"])
+        timings.append((time.perf_counter() - start) / repeats)
+
+        got = {s.field: s.value for s in slots}
+        for field, value in got.items():
+            if field in expected and expected[field] == value:
+                true_pos += 1
+            else:
+                false_pos += 1
+                print(f"  wrong/extra  {field}={value!r:<10} in: {row['text']}")
+        for field, value in expected.items():
+            if got.get(field) != value:
+                false_neg += 1
+                if field not in got:
+                    print(f"  missed       {field}={value!r:<10} in: {row['text']}")
+        exact += got == expected
+
+    precision = true_pos / max(true_pos + false_pos, 1)
+    recall = true_pos / max(true_pos + false_neg, 1)
+    timings.sort()
+    print(f"utterances:        {len(rows)}")
+    print(f"exact match:       {exact}/{len(rows)}")
+    print(f"slot precision:    {precision:.1%}")
+    print(f"slot recall:       {recall:.1%}")
+    print(f"latency mean/p95:  {sum(timings) / len(timings) * 1e6:.0f} us / {timings[int(len(timings) * 0.95)] * 1e6:.0f} us")
+
+
+if __name__ == "__main__":
+    run(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_SET)
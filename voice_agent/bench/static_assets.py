@@ -0,0 +1,165 @@
+"""
+Server-side cost of serving the dashboard: the old handlers (read index.html
+from disk per request, StaticFiles for /static) vs the in-memory
+StaticAssetCache. Requests go straight into the ASGI app (no sockets), so the
+numbers are handler + framework cost only.
+
+Also reports bytes per page load (index.html + script.js) for a first visit
+and for a revisit that revalidates with If-None-Match, and how long an edit
+to script.js (in a temporary copy of static/) takes to show up as a new
+?v= URL in the page a revalidating browser gets.
+
+Usage:
+    python -m voice_agent.bench.static_assets [--requests 3000]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse
+from fastapi.staticfiles import StaticFiles
+
+from ..server.static_assets import StaticAssetCache
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "static")
+INDEX_PATH = os.path.join(STATIC_DIR, "index.html")
+BROWSER_HEADERS = [(b"accept-encoding", b"gzip, deflate, br")]
+
+
+def old_app() -> FastAPI:
+    app = FastAPI()
+    app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
+
+    @app.get("/")
+    async def get():
+        with open(INDEX_PATH, "r", encoding="utf-8") as f:
+            return HTMLResponse(content=f.read())
+    return app
+
+
+def new_app(directory: str = STATIC_DIR) -> FastAPI:
+    app = FastAPI()
+    assets = StaticAssetCache(directory)
+
+    @app.api_route("/", methods=["GET", "HEAD"])
+    async def get(request: Request):
+        return assets.response(request, "index.html")
+
+    @app.api_route("/static/{path:path}", methods=["GET", "HEAD"])
+    async def static_file(request: Request, path: str):
+        return assets.response(request, path)
+    app.state.assets = assets
+    return app
+
+
+async def call(app, path: str, headers=()):
+    """Minimal ASGI client: returns (status, headers dict, body bytes)."""
+    raw_path, _, query = path.partition("?")
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": raw_path, "raw_path": raw_path.encode(), "query_string": query.encode(),
+        "root_path": "", "headers": list(headers), "client": ("127.0.0.1", 1), "server": ("127.0.0.1", 80),
+    }
+    result = {"status": 0, "headers": {}, "body": bytearray()}
+    done = asyncio.Event()
+    requested = False
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await done.wait()  # streaming responses listen for the disconnect
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            result["status"] = message["status"]
+            result["headers"] = {k.decode().lower(): v.decode() for k, v in message.get("headers", [])}
+        elif message["type"] == "http.response.body":
+            result["body"] += message.get("body", b"")
+            if not message.get("more_body", False):
+                done.set()
+
+    await app(scope, receive, send)
+    return result["status"], result["headers"], bytes(result["body"])
+
+
+async def throughput(app, path: str, requests: int, headers=()) -> float:
+    for _ in range(50):
+        await call(app, path, headers)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await call(app, path, headers)
+    return requests / (time.perf_counter() - start)
+
+
+async def page_bytes(app, revisit: bool) -> int:
+    """Bytes for index.html + script.js; a revisit sends back whatever validators it got."""
+    _, _, index = await call(app, "/")
+    script = script_ref(index)
+
+    total = 0
+    for path in ("/", script):
+        _, headers, body = await call(app, path, BROWSER_HEADERS)
+        if revisit:
+            validators = []
+            if "etag" in headers:
+                validators.append((b"if-none-match", headers["etag"].encode()))
+            if "last-modified" in headers:
+                validators.append((b"if-modified-since", headers["last-modified"].encode()))
+            _, _, body = await call(app, path, BROWSER_HEADERS + validators)
+        total += len(body)
+    return total
+
+
+def script_ref(index: bytes) -> str:
+    marker = 'src="/static/js/script.js'
+    return "/static/js/script.js" + index.decode("utf-8").split(marker, 1)[1].split('"', 1)[0]
+
+
+async def edit_pickup(timeout: float = 5.0) -> float:
+    """Edits script.js, then revalidates the page until it names the new version. Returns seconds."""
+    with tempfile.TemporaryDirectory() as directory:
+        shutil.copytree(STATIC_DIR, directory, dirs_exist_ok=True)
+        app = new_app(directory)
+        _, headers, index = await call(app, "/")
+        old_ref = script_ref(index)
+        validators = [(b"if-none-match", headers["etag"].encode())]
+
+        with open(os.path.join(directory, "js", "script.js"), "a", encoding="utf-8") as f:
+            f.write("\n// edited\n")
+        edited = time.perf_counter()
+        # The script itself is not requested: a browser holding it as immutable never would
+        while time.perf_counter() - edited < timeout:
+            status, _, index = await call(app, "/", validators)
+            if status == 200 and script_ref(index) != old_ref:
+                return time.perf_counter() - edited
+            await asyncio.sleep(0.05)
+    raise RuntimeError(f"page still references {old_ref} {timeout:g}s after the edit")
+
+
+async def run(requests: int):
+    logging.getLogger("VoiceAgent").setLevel(logging.WARNING)
+    apps = (("before", old_app()), ("after", new_app()))
+    print(f"{requests} sequential requests per row, in-process ASGI")
+    print(f"{'':<8}{'/ req/s':>10}{'script.js req/s':>17}{'first visit B':>15}{'revisit B':>11}")
+    for name, app in apps:
+        index_rate = await throughput(app, "/", requests, BROWSER_HEADERS)
+        script_rate = await throughput(app, "/static/js/script.js", requests, BROWSER_HEADERS)
+        first = await page_bytes(app, revisit=False)
+        again = await page_bytes(app, revisit=True)
+        print(f"{name:<8}{index_rate:>10.0f}{script_rate:>17.0f}{first:>15}{again:>11}")
+    print(f"script.js edit -> new ?v= in a revalidated page: {await edit_pickup() * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=3000)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests))
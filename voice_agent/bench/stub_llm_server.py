@@ -0,0 +1,75 @@
+"""
+OpenAI/Groq-compatible HTTP stand-in for the planner LLM, built on StubLLMClient.
+
+Answers POST .../chat/completions after the stub's simulated latency plus an
+optional injected tail (`extra_delay`), so hedging and timeouts can be
+exercised over real HTTP without an API key.
+
+Usage:
+    python -m voice_agent.bench.stub_llm_server [port]
+    GROQ_BASE_URL=http://127.0.0.1:8100 PLANNER_BACKEND=groq GROQ_API_KEY=stub ...
+"""
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ..agent.stub_llm import StubLLMClient
+
+
+def make_server(port: int = 0, extra_delay=0.0, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    client = StubLLMClient(extra_delay=extra_delay)
+    lock = threading.Lock()  # StubLLMClient.respond counts calls and may draw random delays
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if not self.path.endswith("/chat/completions"):
+                self.send_error(404)
+                return
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            with lock:
+                content, usage, delay = client.respond(body.get("messages", []), body.get("max_tokens", 500))
+            time.sleep(delay)
+
+            payload = json.dumps({
+                "id": f"stub-{client.calls}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body.get("model", "stub"),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }],
+                "usage": usage,
+            }, ensure_ascii=False).encode("utf-8")
+            try:
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # caller cancelled (lost the hedge race)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    server.stub = client
+    return server
+
+
+def start_in_background(extra_delay=0.0) -> ThreadingHTTPServer:
+    server = make_server(0, extra_delay)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8100
+    server = make_server(port)
+    print(f"Stub LLM listening on http://127.0.0.1:{port}")
+    server.serve_forever()
@@ -0,0 +1,69 @@
+"""
+Counts LLM calls per tool turn with local response templating versus the
+previous "plan + summarize" flow, over every scheme and a spread of caller
+profiles and search queries.
+
+Usage:
+    python -m voice_agent.bench.templating
+"""
+import asyncio
+import time
+
+from ..agent.evaluator import Evaluator
+from ..agent.executor import Executor
+from ..agent.schemas import AgentState, PlannerOutput, PlanStep
+from ..tools.knowledge import SCHEMES_DB
+
+PROFILES = [
+    {"age": 65, "income": 80000},
+    {"age": 40, "income": 90000},
+    {"age": 70, "income": 350000},
+    {"age": 60},
+    {"land_acres": 3.5},
+    {"land_acres": 0},
+    {},
+]
+KEYWORDS = ["పెన్షన్", "రైతు", "వివాహం", "పథకం", "బాలికల"]
+
+
+def tool_turns():
+    for scheme_id in SCHEMES_DB:
+        yield PlanStep(tool_name="search_schemes", arguments={"scheme_id": scheme_id})
+        for profile in PROFILES:
+            yield PlanStep(tool_name="check_eligibility", arguments={**profile, "scheme_id": scheme_id})
+    for keyword in KEYWORDS:
+        yield PlanStep(tool_name="search_schemes", arguments={"keywords": keyword})
+
+
+async def run():
+    executor = Executor()
+    evaluator = Evaluator()
+    turns = templated = summarized = unanswered = 0
+    render_time = 0.0
+
+    for step in tool_turns():
+        plan = PlannerOutput(reasoning="", intent="bench", next_state=AgentState.EXECUTING, tool_calls=[step])
+        result = await executor.execute(step)
+        start = time.perf_counter()
+        evaluation = evaluator.evaluate(plan, [result], "")
+        render_time += time.perf_counter() - start
+        turns += 1
+        if evaluation.action not in ("SYNTHESIZE", "ASK_USER"):
+            unanswered += 1
+        elif evaluation.needs_summary:
+            summarized += 1
+        else:
+            templated += 1
+
+    answered = templated + summarized
+    before = 2.0  # plan + "Summarize results" call for every answered tool turn
+    after = (templated * 1 + summarized * 2) / max(answered, 1)
+    print(f"tool turns:             {turns} ({unanswered} tool failures, not spoken in either flow)")
+    print(f"templated locally:      {templated}")
+    print(f"needed LLM summary:     {summarized}")
+    print(f"LLM calls / tool turn:  {before:.2f} -> {after:.2f}")
+    print(f"mean evaluate+render:   {render_time / max(turns, 1) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
@@ -0,0 +1,133 @@
+"""
+Throughput of POST /api/turn over real HTTP (uvicorn + httpx) with the
+offline stub planner, at increasing client concurrency.
+
+Each client owns its own session and cycles through a short conversation.
+503s are turns shed by admission control (see ADMIT_LLM_*).
+
+Usage:
+    python -m voice_agent.bench.text_api_throughput [--requests 400] [--concurrency 1 8 32 64] [--client-procs 4]
+"""
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import socket
+import threading
+import time
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+
+from ..agent.planner import Planner
+from ..agent.stub_llm import StubLLMClient
+from ..agent.turn import TurnRunner
+from ..server.text_service import router, text_service
+from ..utils.admission import admission
+from ..utils.latency import LatencyTracker
+
+CONVERSATION = [
+    "నమస్కారం",
+    "నా వయస్సు 63 సంవత్సరాలు, ఆదాయం 90 వేలు",
+    "ఆసరా పెన్షన్ కి నేను అర్హుడినా?",
+    "రైతు బంధు గురించి చెప్పండి",
+]
+
+
+def start_server() -> tuple[uvicorn.Server, int]:
+    app = FastAPI()
+    app.include_router(router)
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, port
+
+
+async def _client_batch(url: str, name: str, clients: int, total: int):
+    latencies, statuses = [], {}
+    remaining = total
+
+    async def client(index: int, http: httpx.AsyncClient):
+        nonlocal remaining
+        turn = 0
+        while remaining > 0:
+            remaining -= 1
+            body = {"session_id": f"{name}-{index}", "text": CONVERSATION[turn % len(CONVERSATION)]}
+            turn += 1
+            start = time.perf_counter()
+            response = await http.post(url, json=body)
+            latencies.append(time.perf_counter() - start)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(limits=limits, timeout=30) as http:
+        await asyncio.gather(*(client(i, http) for i in range(clients)))
+    return latencies, statuses
+
+
+def client_process(args, results):
+    # One httpx client tops out around 60 req/s, so load comes from several processes
+    started = time.time()
+    latencies, statuses = asyncio.run(_client_batch(*args))
+    results.put((started, time.time(), latencies, statuses))
+
+
+def run_level(url: str, concurrency: int, total: int, procs: int):
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    procs = min(procs, concurrency)
+    workers = [
+        ctx.Process(target=client_process, args=(
+            (url, f"c{concurrency}p{i}", concurrency // procs + (i < concurrency % procs),
+             total // procs + (i < total % procs)),
+            results,
+        ))
+        for i in range(procs)
+    ]
+    for worker in workers:
+        worker.start()
+    outcomes = [results.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+
+    # Wall time from the clients' own clocks, so process start-up is not counted
+    wall = max(end for _, end, _, _ in outcomes) - min(start for start, _, _, _ in outcomes)
+    latencies = LatencyTracker(window=total)
+    statuses = {}
+    for _, _, samples, codes in outcomes:
+        for sample in samples:
+            latencies.record(sample)
+        for code, n in codes.items():
+            statuses[code] = statuses.get(code, 0) + n
+    return total / wall, latencies, statuses
+
+
+def run(total: int, levels: list[int], procs: int):
+    logging.getLogger("VoiceAgent").setLevel(logging.WARNING)
+    text_service._runner = TurnRunner(Planner(client=StubLLMClient()))
+    server, port = start_server()
+    url = f"http://127.0.0.1:{port}/api/turn"
+    llm = admission.stages["llm"]
+    print(f"up to {total} requests per level (25 per client); llm admission {llm.max_concurrent} concurrent / {llm.max_waiting} queued")
+    print(f"{'clients':>8}{'req/s':>9}{'p50 ms':>9}{'p99 ms':>9}   status")
+    try:
+        for concurrency in levels:
+            rate, lat, statuses = run_level(url, concurrency, min(total, concurrency * 25), procs)
+            codes = ", ".join(f"{code}: {n}" for code, n in sorted(statuses.items()))
+            print(f"{concurrency:>8}{rate:>9.1f}{lat.quantile(0.5) * 1000:>9.0f}{lat.quantile(0.99) * 1000:>9.0f}   {codes}")
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64])
+    parser.add_argument("--client-procs", type=int, default=4)
+    args = parser.parse_args()
+    run(args.requests, args.concurrency, args.client_procs)
@@ -0,0 +1,154 @@
+"""
+Local TTS playback: the old temp-file + pygame path against the in-memory
+decode + callback stream path (utils/audio_playback.py).
+
+Replies come from the offline FakeTTSProducer and are re-encoded to MP3 at
+edge-tts' bitrate, so no network is needed. Output devices are simulated:
+pygame runs on SDL's dummy driver, and the PcmPlayer gets a stream that
+calls its callback in real time from a thread. Both therefore play for the
+true clip length; what differs is the per-utterance overhead around it.
+
+  setup ms   bytes in hand -> audio starting (file write + load, or decode)
+  tail ms    audio finished -> speak() returns (poll interval vs event)
+
+Usage:
+    python -m voice_agent.bench.tts_playback [--clips 6]
+"""
+import argparse
+import asyncio
+import io
+import os
+import tempfile
+import threading
+import time
+
+import av
+import numpy as np
+
+from ..utils.audio_playback import PLAYBACK_SAMPLE_RATE, PcmBuffer, PcmPlayer, decode_into
+from ..utils.latency import LatencyTracker
+from ..utils.tts import FakeTTSProducer
+
+REPLIES = [
+    "సరే.",
+    "మీ వయస్సు 63 సంవత్సరాలు అని నమోదు చేశాను.",
+    "ఆసరా పెన్షన్ కి మీరు అర్హులు. దరఖాస్తు కోసం మీ ఆధార్ కార్డు మరియు బ్యాంక్ పాస్‌బుక్ అవసరం.",
+    "రైతు బంధు పథకం కింద ప్రతి ఎకరానికి సీజన్‌కు ఐదు వేల రూపాయలు అందుతాయి.",
+]
+
+
+def encode_mp3(wav: bytes) -> bytes:
+    """Re-encodes a WAV clip as 24 kHz mono 48 kbit/s MP3, the edge-tts output format."""
+    out = io.BytesIO()
+    with av.open(io.BytesIO(wav)) as src, av.open(out, mode="w", format="mp3") as dst:
+        stream = dst.add_stream("libmp3lame", rate=PLAYBACK_SAMPLE_RATE)
+        stream.bit_rate = 48000
+        stream.layout = "mono"
+        for frame in src.decode(audio=0):
+            frame.pts = None
+            for packet in stream.encode(frame):
+                dst.mux(packet)
+        for packet in stream.encode(None):
+            dst.mux(packet)
+    return out.getvalue()
+
+
+class SimulatedOutputStream:
+    """Stands in for sounddevice.OutputStream: pulls a block from the callback every block period."""
+
+    def __init__(self, samplerate, channels, dtype, blocksize, callback):
+        self.period = blocksize / samplerate
+        self.latency = self.period  # one block queued in the "device"
+        self.block = np.zeros((blocksize, channels), dtype=dtype)
+        self.callback = callback
+        self.running = False
+
+    def start(self):
+        self.running = True
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _run(self):
+        next_tick = time.perf_counter()
+        while self.running:
+            self.callback(self.block, len(self.block), None, None)
+            next_tick += self.period
+            time.sleep(max(0.0, next_tick - time.perf_counter()))
+
+    def stop(self):
+        self.running = False
+
+    def close(self):
+        pass
+
+
+async def pygame_path(pygame, mp3: bytes, seconds: float):
+    """The previous _play_local, minus synthesis."""
+    start = time.perf_counter()
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
+    temp_path = temp_file.name
+    temp_file.close()
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(mp3)
+        pygame.mixer.music.load(temp_path)
+        pygame.mixer.music.play()
+        playing = time.perf_counter()
+        check_count = 0
+        while pygame.mixer.music.get_busy():
+            await asyncio.sleep(0.05 if check_count < 10 else 0.1)
+            check_count += 1
+        pygame.mixer.music.unload()
+    finally:
+        os.remove(temp_path)
+    return playing - start, time.perf_counter() - playing - seconds
+
+
+async def memory_path(player: PcmPlayer, pcm: PcmBuffer, mp3: bytes, seconds: float):
+    start = time.perf_counter()
+    await asyncio.to_thread(decode_into, mp3, pcm, player.sample_rate)
+    playing = time.perf_counter()
+    await player.play(pcm)
+    return playing - start, time.perf_counter() - playing - seconds
+
+
+async def run(clips: int):
+    producer = FakeTTSProducer(sample_rate=PLAYBACK_SAMPLE_RATE)
+    replies = [REPLIES[i % len(REPLIES)] for i in range(clips)]
+    mp3s = [encode_mp3(producer.render(text)) for text in replies]
+    pcm = PcmBuffer(capacity=PLAYBACK_SAMPLE_RATE)  # deliberately small: grows once, then reused
+    durations = [decode_into(mp3, pcm) / PLAYBACK_SAMPLE_RATE for mp3 in mp3s]
+    print(f"{clips} clips, {sum(durations):.1f}s of audio, {sum(map(len, mp3s)) / 1024:.0f} KiB MP3 (played in real time)")
+    print(f"{'path':<16}{'setup p50':>10}{'setup max':>10}{'tail p50':>10}{'tail max':>10}{'temp files':>12}")
+
+    paths = []
+    try:
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "hide"
+        import pygame
+
+        pygame.mixer.init(frequency=PLAYBACK_SAMPLE_RATE, channels=1)
+        paths.append(("pygame+tempfile", lambda mp3, s: pygame_path(pygame, mp3, s), len(mp3s)))
+    except Exception as e:
+        print(f"(pygame baseline skipped: {e})")
+
+    player = PcmPlayer(stream_factory=SimulatedOutputStream)
+    paths.append(("memory+callback", lambda mp3, s: memory_path(player, pcm, mp3, s), 0))
+
+    for name, play, temp_files in paths:
+        setup, tail = LatencyTracker(window=clips), LatencyTracker(window=clips)
+        for mp3, seconds in zip(mp3s, durations):
+            s, t = await play(mp3, seconds)
+            setup.record(s * 1000)
+            tail.record(t * 1000)
+        print(
+            f"{name:<16}{setup.quantile(0.5):>10.1f}{max(setup.samples):>10.1f}"
+            f"{tail.quantile(0.5):>10.1f}{max(tail.samples):>10.1f}{temp_files:>12}"
+        )
+    player.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clips", type=int, default=6)
+    args = parser.parse_args()
+    asyncio.run(run(args.clips))
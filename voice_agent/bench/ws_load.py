@@ -0,0 +1,310 @@
+"""
+Saturation curve for the dashboard WebSocket (/ws) of one uvicorn process
+running voice_agent.app, fully offline (PLANNER_BACKEND=stub, TTS_BACKEND=stub).
+
+For each client count the server is started fresh, the clients connect
+(spread over --client-procs processes) and typed `text` messages are sent
+at --rate per second in total, each from a randomly chosen client. Clients
+behave like browsers: they receive every broadcast (including streamed
+audio) and ack each utterance with `playback_done` as soon as it ends.
+
+  connect   socket open -> initial `status` event
+  pickup    text sent -> its `transcript` echo (the agent loop took it)
+  reply     text sent -> the agent's reply `transcript` (incl. TTS streaming)
+  fan-out   first -> last client receiving the same transcript broadcast
+  rss       server resident memory, idle after start-up and peak under load
+
+All dashboard sessions share one agent loop, so turns are served one at a
+time; past its capacity the pickup time grows with the backlog, and
+`replied` falls behind `sent`.
+
+Usage:
+    python -m voice_agent.bench.ws_load [--clients 1 10 50 100 200] [--rate 1.0] [--duration 15] [--client-procs 4]
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import httpx
+from websockets.asyncio.client import connect
+
+from ..utils.admission import HOLD_PROMPT
+from ..utils.latency import LatencyTracker
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+MESSAGES = [
+    "నమస్కారం",
+    "నా వయస్సు 63 సంవత్సరాలు, ఆదాయం 90 వేలు",
+    "ఆసరా పెన్షన్ కి నేను అర్హుడినా?",
+    "రైతు బంధు గురించి చెప్పండి",
+]
+
+SERVER_ENV = {
+    "PLANNER_BACKEND": "stub",
+    "TTS_BACKEND": "stub",
+    "AUDIO_OUTPUT": "browser",
+    "BARGE_IN": "0",
+    "LOG_LEVEL": "WARNING",
+    "HF_HUB_OFFLINE": "1",  # Whisper is not needed for typed turns; fail fast instead of downloading
+}
+
+
+class ServerProcess:
+    """`uvicorn voice_agent.app:app` in a child process, with its RSS sampled in the background."""
+
+    def __init__(self):
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            self.port = s.getsockname()[1]
+        self.proc = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "voice_agent.app:app",
+             "--host", "127.0.0.1", "--port", str(self.port), "--log-level", "warning"],
+            cwd=ROOT,
+            env={**os.environ, **SERVER_ENV},
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        self.peak_rss = 0.0
+        self._sampling = False
+
+    @property
+    def url(self) -> str:
+        return f"ws://127.0.0.1:{self.port}/ws"
+
+    def wait_ready(self, timeout: float = 120.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.proc.poll() is not None:
+                raise RuntimeError(f"server exited:\n{self.proc.stderr.read().decode(errors='replace')[-2000:]}")
+            try:
+                if httpx.get(f"http://127.0.0.1:{self.port}/metrics", timeout=1.0).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.2)
+        raise RuntimeError("server did not start")
+
+    def rss_mb(self) -> float:
+        # Linux only; reports 0 elsewhere
+        try:
+            with open(f"/proc/{self.proc.pid}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        return int(line.split()[1]) / 1024
+        except OSError:
+            pass
+        return 0.0
+
+    def start_sampling(self, interval: float = 0.25):
+        self._sampling = True
+
+        def sample():
+            while self._sampling:
+                self.peak_rss = max(self.peak_rss, self.rss_mb())
+                time.sleep(interval)
+
+        threading.Thread(target=sample, daemon=True).start()
+
+    def stop(self):
+        self._sampling = False
+        self.proc.terminate()
+        try:
+            self.proc.wait(10)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+
+
+class DashboardClient:
+    """One simulated browser tab."""
+
+    def __init__(self, ws, stats: dict, opened: float):
+        self.ws = ws
+        self.stats = stats
+        self.opened = opened
+        self.connected = asyncio.Event()
+        self.sent: dict[str, float] = {}
+        self.awaiting_reply: list[float] = []
+        self.closing = False
+
+    async def send_text(self, text: str):
+        self.sent[text] = time.time()
+        self.stats["sent"] += 1
+        await self.ws.send(json.dumps({"type": "text", "payload": text}))
+
+    async def receive(self):
+        stats = self.stats
+        try:
+            async for raw in self.ws:
+                now = time.time()
+                message = json.loads(raw)
+                kind, payload = message.get("type"), message.get("payload")
+                if kind == "status" and not self.connected.is_set():
+                    stats["connect"].append(now - self.opened)
+                    self.connected.set()
+                elif kind == "transcript":
+                    key = (payload["role"], payload["text"])
+                    first, last, count = stats["seen"].get(key, (now, now, 0))
+                    stats["seen"][key] = (min(first, now), max(last, now), count + 1)
+                    sent_at = self.sent.pop(payload["text"], None) if payload["role"] == "user" else None
+                    if sent_at is not None:
+                        stats["pickup"].append(now - sent_at)
+                        self.awaiting_reply.append(sent_at)
+                    elif payload["role"] == "agent" and self.awaiting_reply:
+                        stats["reply"].append(now - self.awaiting_reply.pop(0))
+                        stats["shed" if payload["text"] == HOLD_PROMPT else "replied"] += 1
+                elif kind == "audio_chunk":
+                    stats["audio_bytes"] += len(payload["data"])
+                elif kind == "audio_end":
+                    await self.ws.send(json.dumps({"type": "playback_done", "payload": payload["id"]}))
+        except Exception:
+            if not self.closing:
+                stats["dropped"] += 1
+
+    @property
+    def outstanding(self) -> int:
+        return len(self.sent) + len(self.awaiting_reply)
+
+
+async def _run_clients(url: str, count: int, rate: float, duration: float, drain: float, tag: str, barrier) -> dict:
+    stats = {
+        "connect": [], "pickup": [], "reply": [], "seen": {},
+        "sent": 0, "replied": 0, "shed": 0, "dropped": 0, "failed": 0, "audio_bytes": 0,
+    }
+    rng = random.Random(tag)
+    clients: list[DashboardClient] = []
+    readers = []
+
+    async def open_client():
+        opened = time.time()
+        try:
+            ws = await connect(url, max_size=None, ping_interval=None, open_timeout=30)
+        except Exception:
+            stats["failed"] += 1
+            return
+        client = DashboardClient(ws, stats, opened)
+        clients.append(client)
+        readers.append(asyncio.create_task(client.receive()))
+        await asyncio.wait_for(client.connected.wait(), 30)
+
+    await asyncio.gather(*(open_client() for _ in range(count)), return_exceptions=True)
+    # Every process starts sending only once all clients everywhere are connected
+    await asyncio.to_thread(barrier.wait)
+
+    if clients:
+        interval = 1.0 / rate if rate > 0 else duration
+        end = time.monotonic() + duration
+        turn = 0
+        while time.monotonic() < end:
+            text = f"{MESSAGES[turn % len(MESSAGES)]} [{tag}-{turn}]"
+            turn += 1
+            await rng.choice(clients).send_text(text)
+            await asyncio.sleep(rng.expovariate(1.0 / interval))
+
+        deadline = time.monotonic() + drain
+        while time.monotonic() < deadline and any(c.outstanding for c in clients):
+            await asyncio.sleep(0.1)
+
+    for client in clients:
+        client.closing = True
+        await client.ws.close()
+    await asyncio.gather(*readers, return_exceptions=True)
+    return stats
+
+
+def client_process(args, barrier, results):
+    results.put(asyncio.run(_run_clients(*args, barrier)))
+
+
+def run_level(clients: int, rate: float, duration: float, drain: float, procs: int) -> dict:
+    server = ServerProcess()
+    try:
+        server.wait_ready()
+        time.sleep(1.0)  # let the agent loop finish its start-up greeting
+        idle_rss = server.rss_mb()
+        server.start_sampling()
+
+        ctx = multiprocessing.get_context("spawn")
+        procs = max(1, min(procs, clients))
+        barrier = ctx.Barrier(procs)
+        results = ctx.Queue()
+        workers = []
+        for i in range(procs):
+            count = clients // procs + (i < clients % procs)
+            args = (server.url, count, rate * count / clients, duration, drain, f"n{clients}p{i}")
+            workers.append(ctx.Process(target=client_process, args=(args, barrier, results)))
+        for worker in workers:
+            worker.start()
+        outcomes = [results.get() for _ in workers]
+        for worker in workers:
+            worker.join()
+    finally:
+        server.stop()
+
+    total = {key: 0 for key in ("sent", "replied", "shed", "dropped", "failed", "audio_bytes")}
+    trackers = {name: LatencyTracker(window=1_000_000) for name in ("connect", "pickup", "reply", "fanout")}
+    seen: dict = {}
+    for stats in outcomes:
+        for key in total:
+            total[key] += stats[key]
+        for name in ("connect", "pickup", "reply"):
+            for sample in stats[name]:
+                trackers[name].record(sample)
+        for key, (first, last, count) in stats["seen"].items():
+            if key in seen:
+                f, l, c = seen[key]
+                seen[key] = (min(f, first), max(l, last), c + count)
+            else:
+                seen[key] = (first, last, count)
+    # Only broadcasts every connected client received
+    connected = clients - total["failed"]
+    for first, last, count in seen.values():
+        if count == connected:
+            trackers["fanout"].record(last - first)
+    return {**total, **trackers, "idle_rss": idle_rss, "peak_rss": server.peak_rss, "clients": clients}
+
+
+def _ms(tracker: LatencyTracker, q: float) -> str:
+    value = tracker.quantile(q)
+    return "-" if value is None else f"{value * 1000:.0f}"
+
+
+def run(levels: list[int], rate: float, duration: float, drain: float, procs: int):
+    print(f"{rate:g} text msg/s for {duration:g}s per level (+{drain:g}s drain), stub planner + stub TTS")
+    print("latencies in ms (p50/p99), memory in MB")
+    header = (
+        f"{'clients':>8}{'sent':>6}{'reply':>6}{'shed':>5}{'fail':>5}"
+        f"{'conn p99':>9}{'pick p50':>9}{'pick p99':>9}{'reply p50':>10}{'reply p99':>10}"
+        f"{'fan p50':>8}{'fan p99':>8}{'rss idle':>9}{'rss peak':>9}{'MB/client':>10}"
+    )
+    print(header)
+    for clients in levels:
+        r = run_level(clients, rate, duration, drain, procs)
+        per_client = r["audio_bytes"] / max(1, clients - r["failed"]) / 1e6
+        print(
+            f"{clients:>8}{r['sent']:>6}{r['replied']:>6}{r['shed']:>5}{r['failed'] + r['dropped']:>5}"
+            f"{_ms(r['connect'], 0.99):>9}{_ms(r['pickup'], 0.5):>9}{_ms(r['pickup'], 0.99):>9}"
+            f"{_ms(r['reply'], 0.5):>10}{_ms(r['reply'], 0.99):>10}"
+            f"{_ms(r['fanout'], 0.5):>8}{_ms(r['fanout'], 0.99):>8}"
+            f"{r['idle_rss']:>9.0f}{r['peak_rss']:>9.0f}{per_client:>10.2f}",
+            flush=True,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 10, 50, 100, 200])
+    parser.add_argument("--rate", type=float, default=1.0, help="text messages per second, all clients together")
+    parser.add_argument("--duration", type=float, default=15.0, help="seconds of sending per level")
+    parser.add_argument("--drain", type=float, default=15.0, help="max seconds to wait for outstanding replies")
+    parser.add_argument("--client-procs", type=int, default=4)
+    args = parser.parse_args()
+    run(args.clients, args.rate, args.duration, args.drain, args.client_procs)
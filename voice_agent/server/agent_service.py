@@ -1,12 +1,12 @@
 import asyncio
+import time
 from ..utils.voice_io import VoiceInterface
-from ..agent.planner import Planner
-from ..agent.executor import Executor
-from ..agent.evaluator import Evaluator
 from ..agent.memory import MemoryManager
-from ..agent.schemas import AgentState
+from ..agent.turn import TurnRunner
 from .state_manager import StateManager
-from ..utils.logger import logger
+from ..utils.admission import HOLD_PROMPT, Overloaded, admission
+from ..utils.logger import logger, new_session_id, new_turn_id
+from ..utils.metrics import span, TURNS, BARGE_IN_SECONDS, CONFIRMATIONS
 
 class AgentService:
     def __init__(self):
@@ -23,24 +23,32 @@ class AgentService:
         self.running = False
 
     async def _run_loop(self):
+        new_session_id()
         logger.info("Agent Service Started")
         
         try:
-            voice = VoiceInterface()
-            planner = Planner()
-            executor = Executor()
-            evaluator = Evaluator()
-            memory = MemoryManager()
+            self.voice = voice = VoiceInterface(audio_sink=self.state_manager)
+            self.turns = TurnRunner()
+            self.memory = MemoryManager()
             
             # Initial Greeting
             await self.state_manager.set_status("SPEAKING")
             greeting = "నమస్కారం! నేను తెలంగాణ ప్రభుత్వ సంక్షేమ పథకాల సహాయకుడు. మీకు ఏ పథకం గురించి తెలుసుకోవాలి లేదా ఏ దరఖాస్తుకు సహాయం కావాలి? మైక్ బటన్‌పై నొక్కి తెలుగులో మాట్లాడండి లేదా సందేశాన్ని టైప్ చేయండి."
             await self.state_manager.add_transcript("agent", greeting)
-            await voice.speak(greeting)
+            try:
+                with span("voice.speak"):
+                    await voice.speak(greeting)
+            except Overloaded:
+                logger.warning("[TTS] Greeting shed by admission control; shown as text only")
             await self.state_manager.set_status("IDLE")
+            # Cached so it still plays when TTS is the saturated stage
+            asyncio.create_task(voice.warm_prompt(HOLD_PROMPT))
 
             while self.running:
                 try:
+                    # Before recording, so the ASR and confirmation logs carry this turn's id
+                    new_turn_id()
+
                     # 0. Check if there is any typed text from UI (fallback)
                     typed_text = await self.state_manager.consume_text_input()
                     if typed_text:
@@ -61,8 +69,10 @@ class AgentService:
                         if self.state_manager.status != "LISTENING":
                              await self.state_manager.set_status("LISTENING")
                         
-                        # Use Whisper with quality metadata
-                        user_text, quality = await asyncio.to_thread(voice.listen_with_quality)
+                        # Use Whisper with word-level rescoring against the scheme/profile lexicon
+                        with span("voice.listen"):
+                            heard = await self._listen(dict(self.memory.profile))
+                        user_text = heard.text
 
                         if not user_text:
                             # No valid Telugu speech detected, go back to idle and continue loop
@@ -70,20 +80,24 @@ class AgentService:
                             await asyncio.sleep(0.1)
                             continue
 
-                        # Only confirm if quality is low (optional confirmation for better UX)
-                        # Skip confirmation for high-quality transcriptions to speed up interaction
-                        if quality and quality < 0.7:  # Low confidence threshold
+                        # Only confirm the one word that stayed uncertain after rescoring;
+                        # confident or lexicon-corrected transcripts go straight through
+                        slot = heard.confirmation_slot
+                        CONFIRMATIONS.inc(outcome="asked" if slot else "skipped")
+                        if slot:
                             confirm_prompt = (
-                                f"మీరు ఇలా అన్నారా: \"{user_text}\"? "
+                                f"\"{slot.text.strip()}\" అని అన్నారా? "
                                 "సరి అయితే 'అవును' అని, కాకపోతే 'కాదు' అని చెప్పండి."
                             )
                             await self.state_manager.set_status("SPEAKING")
                             await self.state_manager.add_transcript("agent", confirm_prompt)
-                            await voice.speak(confirm_prompt)
+                            with span("voice.speak"):
+                                await voice.speak(confirm_prompt)
 
                             # Listen briefly for confirmation
                             await self.state_manager.set_status("LISTENING")
-                            confirm_text, _ = await asyncio.to_thread(voice.listen_with_quality)
+                            with span("voice.listen"):
+                                confirm_text = (await self._listen()).text
 
                             if not confirm_text or ("అవును" not in confirm_text and "yes" not in confirm_text.lower()):
                                 # Ask user to either repeat or use text input
@@ -93,7 +107,8 @@ class AgentService:
                                 )
                                 await self.state_manager.set_status("SPEAKING")
                                 await self.state_manager.add_transcript("agent", retry_msg)
-                                await voice.speak(retry_msg)
+                                with span("voice.speak"):
+                                    await voice.speak(retry_msg)
                                 await self.state_manager.set_status("IDLE")
                                 await asyncio.sleep(0.1)
                                 continue
@@ -101,67 +116,26 @@ class AgentService:
 
                     # Log user text for both voice and typed input
                     await self.state_manager.add_transcript("user", user_text)
-                    await self.state_manager.set_status("THINKING")
-
-                    # Update Memory
-                    memory.add_turn("user", user_text)
-
-                    # 2. PLAN
-                    context = memory.get_context_block()
-                    await self.state_manager.add_thought(f"Planning for: {user_text}")
-                    plan = await planner.plan(user_text, context)
-                    await self.state_manager.add_thought(f"Intent: {plan.intent}")
-
-                    # 3. ACT
-                    if plan.next_state == AgentState.SPEAKING:
-                        response = plan.response_text_if_any or "..."
-                        await self.state_manager.set_status("SPEAKING")
-                        # Show transcript immediately for instant user feedback
-                        await self.state_manager.add_transcript("agent", response)
-                        # Voice plays after transcript is shown (non-blocking for UI, but sequential for audio)
-                        await voice.speak(response)
-                        memory.add_turn("agent", response)
-                    
-                    elif plan.next_state == AgentState.EXECUTING:
-                        tool_results = []
-                        for step in plan.tool_calls:
-                            await self.state_manager.add_thought(f"Executing: {step.tool_name}")
-                            result = await executor.execute(step)
-                            tool_results.append(result)
-                            await self.state_manager.add_thought(f"Result: {result.success}")
-                        
-                        evaluation = evaluator.evaluate(plan, tool_results, context)
-                        
-                        if evaluation.action == "SYNTHESIZE":
-                            # Quick Synthesis - use evaluator's clean_response if available, otherwise synthesize
-                            await self.state_manager.add_thought(f"Synthesizing response...")
-                            
-                            # If evaluator already provided a good response, use it directly
-                            if evaluation.clean_response and len(evaluation.clean_response.strip()) > 20:
-                                final_resp = evaluation.clean_response
-                            else:
-                                # Otherwise, synthesize with planner
-                                result_context = f"User asked: {user_text}. Tool results: {evaluation.clean_response}"
-                                final_plan = await planner.plan("Summarize results in simple Telugu", result_context)
-                                final_resp = final_plan.response_text_if_any or evaluation.clean_response or "సమాచారం సిద్ధంగా ఉంది."
-                            
-                            await self.state_manager.set_status("SPEAKING")
-                            # Show transcript immediately for instant user feedback
-                            await self.state_manager.add_transcript("agent", final_resp)
-                            await voice.speak(final_resp)
-                            memory.add_turn("agent", final_resp)
-
-                        elif evaluation.action == "ASK_USER":
-                             await self.state_manager.set_status("SPEAKING")
-                             # Show transcript immediately for instant user feedback
-                             await self.state_manager.add_transcript("agent", evaluation.clean_response)
-                             await voice.speak(evaluation.clean_response)
-                             memory.add_turn("agent", evaluation.clean_response)
-                    
+
+                    # 2-3. PLAN + ACT (cancelled as a whole if the caller barges in)
+                    if await self._run_interruptible(self._respond(user_text)):
+                        await self.state_manager.add_thought("Barge-in: caller interrupted, listening...")
+                        continue
+
                     await self.state_manager.set_status("IDLE")
+                    TURNS.inc(source="text" if is_text else "voice")
                     # Reduced sleep for faster response cycle
                     await asyncio.sleep(0.05)
 
+                except Overloaded as e:
+                    # Shed under load: answer at once instead of queueing behind a saturated stage
+                    await self.state_manager.add_thought(f"Busy ({e.stage}): asking caller to hold")
+                    await self.state_manager.set_status("SPEAKING")
+                    await self.state_manager.add_transcript("agent", HOLD_PROMPT)
+                    await voice.speak(HOLD_PROMPT, cache=True)
+                    await self.state_manager.set_status("IDLE")
+                    await asyncio.sleep(0.5)
+
                 except Exception as e:
                     logger.error(f"Error in Agent Loop Iteration: {e}")
                     await self.state_manager.add_thought(f"ERROR: {e} - Recovering...")
@@ -173,3 +147,60 @@ class AgentService:
             logger.critical(f"Agent Service CRASHED: {e}")
             await self.state_manager.add_thought(f"CRITICAL SYSTEM FAILURE: {e}")
             self.running = False
+
+    async def _listen(self, profile: dict | None = None):
+        """Records, then transcribes under the ASR admission limit (recording itself is not limited)."""
+        recording = await asyncio.to_thread(self.voice.record)
+        async with admission.stage("asr"):
+            return await asyncio.to_thread(self.voice.transcribe, recording, profile)
+
+    async def _run_interruptible(self, turn) -> bool:
+        """
+        Runs `turn` while watching the mic for caller speech.
+        On barge-in the turn task is cancelled (stopping playback, pending TTS and
+        any planner call) and True is returned; the captured audio is picked up
+        by the next `listen_with_details` call.
+        """
+        task = asyncio.create_task(turn)
+        if not self.state_manager.listening_active or not self.voice.start_barge_in():
+            await task
+            return False
+
+        monitor = self.voice.barge_in
+        watcher = asyncio.create_task(monitor.wait())
+        try:
+            await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+            if task.done():
+                task.result()  # re-raise turn errors into the loop's handler
+                return False
+
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            stopped = time.perf_counter()
+            BARGE_IN_SECONDS.observe(monitor.trigger_time - monitor.onset_time, stage="detect")
+            BARGE_IN_SECONDS.observe(stopped - monitor.onset_time, stage="stop")
+            logger.info(
+                "[BARGE-IN] detected %.0f ms, audio stopped %.0f ms after speech onset",
+                (monitor.trigger_time - monitor.onset_time) * 1000, (stopped - monitor.onset_time) * 1000,
+            )
+            return True
+        finally:
+            watcher.cancel()
+            self.voice.stop_barge_in()
+
+    async def _respond(self, user_text: str):
+        """Plans, runs tools and speaks the reply for one user turn."""
+        await self.state_manager.set_status("THINKING")
+        result = await self.turns.run(self.memory, user_text, on_thought=self.state_manager.add_thought)
+        if not result.reply:
+            return
+
+        await self.state_manager.set_status("SPEAKING")
+        # Show transcript immediately for instant user feedback
+        await self.state_manager.add_transcript("agent", result.reply)
+        # Voice plays after transcript is shown (non-blocking for UI, but sequential for audio)
+        with span("voice.speak"):
+            await self.voice.speak(result.reply)
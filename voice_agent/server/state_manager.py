@@ -1,6 +1,8 @@
 import asyncio
+import time
 from typing import List, Dict, Any
 from ..utils.logger import logger
+from ..utils.metrics import STATE_SECONDS, STATE_TRANSITIONS, ACTIVE_SESSIONS, QUEUE_DEPTH
 
 class StateManager:
     _instance = None
@@ -9,6 +11,7 @@ class StateManager:
         if cls._instance is None:
             cls._instance = super(StateManager, cls).__new__(cls)
             cls._instance.status = "IDLE" # IDLE, LISTENING, THINKING, SPEAKING
+            cls._instance._status_since = time.perf_counter()
             cls._instance.transcript = []
             cls._instance.thoughts = []
             cls._instance.websockets = []
@@ -16,6 +19,8 @@ class StateManager:
             cls._instance.listening_active = False
             # queue of typed text inputs from UI
             cls._instance._text_queue: List[str] = []
+            # utterance id -> event set when a client finishes playing streamed TTS
+            cls._instance._playback_done: Dict[str, asyncio.Event] = {}
         return cls._instance
 
     async def broadcast(self, message: Dict[str, Any]):
@@ -31,10 +36,23 @@ class StateManager:
                 disconnected.append(ws)
         
         for ws in disconnected:
-            self.websockets.remove(ws)
+            self.remove_websocket(ws)
+
+    def add_websocket(self, websocket):
+        self.websockets.append(websocket)
+        ACTIVE_SESSIONS.set(len(self.websockets), channel="dashboard")
+
+    def remove_websocket(self, websocket):
+        if websocket in self.websockets:
+            self.websockets.remove(websocket)
+        ACTIVE_SESSIONS.set(len(self.websockets), channel="dashboard")
 
     async def set_status(self, status: str):
         if self.status != status:
+            now = time.perf_counter()
+            STATE_SECONDS.observe(now - self._status_since, state=self.status)
+            STATE_TRANSITIONS.inc(source=self.status, target=status)
+            self._status_since = now
             self.status = status
             await self.broadcast({"type": "status", "payload": status})
 
@@ -52,12 +70,39 @@ class StateManager:
         # Only add to queue - don't broadcast yet, let agent_service handle it after processing
         # This prevents duplicate messages
         self._text_queue.append(text)
+        QUEUE_DEPTH.set(len(self._text_queue), queue="text_input")
 
     async def consume_text_input(self) -> str | None:
         """Retrieve the next typed user message if available."""
         if not self._text_queue:
             return None
-        return self._text_queue.pop(0)
+        text = self._text_queue.pop(0)
+        QUEUE_DEPTH.set(len(self._text_queue), queue="text_input")
+        return text
+
+    def expect_playback(self, utterance_id: str):
+        """Registers an utterance before its audio is sent, so an ack that arrives early is kept."""
+        self._playback_done.setdefault(utterance_id, asyncio.Event())
+
+    def forget_playback(self, utterance_id: str):
+        self._playback_done.pop(utterance_id, None)
+
+    async def wait_playback_done(self, utterance_id: str, timeout: float):
+        """Waits until any dashboard client reports it finished playing `utterance_id`."""
+        if not self.websockets:
+            return
+        event = self._playback_done.setdefault(utterance_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.debug("Playback ack timed out for %s", utterance_id)
+        finally:
+            self._playback_done.pop(utterance_id, None)
+
+    def mark_playback_done(self, utterance_id: str):
+        event = self._playback_done.get(utterance_id)
+        if event:
+            event.set()
 
     async def add_transcript(self, role: str, text: str):
         entry = {"role": role, "text": text}
@@ -0,0 +1,174 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from ..utils.logger import logger
+
+try:
+    import brotli  # optional: pip install brotli
+except ImportError:
+    brotli = None
+
+# Files smaller than this are not worth compressing
+MIN_COMPRESS_BYTES = 1024
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+_STATIC_REF_RE = re.compile(r'((?:src|href)=")(/static/[^"?#]+)(")')
+
+
+@dataclass
+class Asset:
+    path: str
+    mtime: float
+    content_type: str
+    version: str  # content hash prefix, used as the ETag and in ?v= URLs
+    body: bytes
+    gzip: Optional[bytes] = None
+    br: Optional[bytes] = None
+    checked_at: float = 0.0
+    # For pages: version of each referenced asset embedded as ?v=
+    refs: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.version}"'
+
+
+class StaticAssetCache:
+    """
+    Dashboard files held in memory with gzip/brotli variants built once.
+
+    Every asset gets a content-hash ETag and answers If-None-Match with 304.
+    index.html is rewritten so its /static/ references carry `?v=<hash>`;
+    those versioned URLs are served as immutable, everything else is
+    revalidated. A file is re-read only when its mtime changes (checked at
+    most every `check_interval` seconds); a page is rebuilt when a file it
+    references has changed, so it never points at a stale ?v= URL.
+    """
+
+    def __init__(self, directory: str, check_interval: float = 1.0):
+        self.directory = os.path.abspath(directory)
+        self.check_interval = check_interval
+        self.assets: Dict[str, Asset] = {}
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                self._load(os.path.relpath(os.path.join(root, name), self.directory).replace(os.sep, "/"))
+        logger.info(
+            "[STATIC] %d assets cached (gzip%s)", len(self.assets), ", brotli" if brotli else ""
+        )
+
+    def _load(self, rel_path: str) -> Optional[Asset]:
+        full_path = os.path.join(self.directory, rel_path)
+        try:
+            mtime = os.stat(full_path).st_mtime
+            with open(full_path, "rb") as f:
+                body = f.read()
+        except OSError:
+            self.assets.pop(rel_path, None)
+            return None
+
+        refs: Dict[str, str] = {}
+        if rel_path.endswith(".html"):
+            def versioned_ref(match) -> str:
+                ref = match.group(2)[len("/static/"):]
+                asset = self.assets.get(ref) or self._load(ref)
+                if asset is None:
+                    return match.group(0)
+                refs[ref] = asset.version
+                return f"{match.group(1)}{match.group(2)}?v={asset.version}{match.group(3)}"
+
+            body = _STATIC_REF_RE.sub(versioned_ref, body.decode("utf-8")).encode("utf-8")
+
+        content_type = mimetypes.guess_type(rel_path)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type in ("application/javascript", "application/json"):
+            content_type += "; charset=utf-8"
+        asset = Asset(
+            path=rel_path,
+            mtime=mtime,
+            content_type=content_type,
+            version=hashlib.sha1(body).hexdigest()[:12],
+            body=body,
+            checked_at=time.monotonic(),
+            refs=refs,
+        )
+        if len(body) >= MIN_COMPRESS_BYTES and _compressible(content_type):
+            asset.gzip = gzip.compress(body, compresslevel=9, mtime=0)
+            if brotli:
+                asset.br = brotli.compress(body, quality=11)
+        self.assets[rel_path] = asset
+        return asset
+
+    def get(self, rel_path: str) -> Optional[Asset]:
+        asset = self.assets.get(rel_path)
+        if asset is None:
+            # A file added after startup; never look outside the static directory
+            full_path = os.path.normpath(os.path.join(self.directory, rel_path))
+            if not full_path.startswith(self.directory + os.sep) or not os.path.isfile(full_path):
+                return None
+            return self._load(os.path.relpath(full_path, self.directory).replace(os.sep, "/"))
+        asset = self._refresh(rel_path, asset)
+        if asset is not None and asset.refs:
+            # A page: rebuild it when a file it references changed, even if that
+            # file has not been requested yet (browsers hold the old ?v= as immutable)
+            stale = False
+            for ref, version in asset.refs.items():
+                current = self.assets.get(ref)
+                current = self._refresh(ref, current) if current is not None else self._load(ref)
+                stale = stale or current is None or current.version != version
+            if stale:
+                logger.info("[STATIC] Assets of %s changed, rebuilding", rel_path)
+                asset = self._load(rel_path)
+        return asset
+
+    def _refresh(self, rel_path: str, asset: Asset) -> Optional[Asset]:
+        """Re-reads the file if its mtime changed (checked at most every check_interval)."""
+        now = time.monotonic()
+        if now - asset.checked_at < self.check_interval:
+            return asset
+        asset.checked_at = now
+        try:
+            changed = os.stat(os.path.join(self.directory, rel_path)).st_mtime != asset.mtime
+        except OSError:
+            changed = True
+        if not changed:
+            return asset
+        logger.info("[STATIC] %s changed, reloading", rel_path)
+        return self._load(rel_path)
+
+    def response(self, request: Request, rel_path: str) -> Response:
+        asset = self.get(rel_path)
+        if asset is None:
+            return Response(status_code=404)
+
+        # Only a URL naming the current content may be cached forever
+        versioned = request.query_params.get("v") == asset.version
+        headers = {
+            "ETag": asset.etag,
+            "Cache-Control": IMMUTABLE if versioned else REVALIDATE,
+            "Vary": "Accept-Encoding",
+        }
+        if asset.etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers=headers)
+
+        accept = request.headers.get("accept-encoding", "")
+        body = asset.body
+        if asset.br is not None and "br" in accept:
+            body, headers["Content-Encoding"] = asset.br, "br"
+        elif asset.gzip is not None and "gzip" in accept:
+            body, headers["Content-Encoding"] = asset.gzip, "gzip"
+        return Response(content=body, media_type=asset.content_type, headers=headers)
+
+
+def _compressible(content_type: str) -> bool:
+    return content_type.startswith("text/") or any(
+        kind in content_type for kind in ("javascript", "json", "svg", "xml")
+    )
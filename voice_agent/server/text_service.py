@@ -0,0 +1,103 @@
+import asyncio
+import time
+from collections import OrderedDict
+
+from fastapi import APIRouter, HTTPException
+
+from ..agent.memory import MemoryManager
+from ..agent.schemas import TurnRequest, TurnResponse
+from ..agent.turn import TurnRunner
+from ..utils.admission import HOLD_PROMPT, Overloaded
+from ..utils.logger import logger, session_id, new_turn_id
+from ..utils.metrics import ACTIVE_SESSIONS, TURNS
+
+NO_REPLY = "క్షమించండి, దీనికి ఇప్పుడు సమాధానం ఇవ్వలేకపోతున్నాను. దయచేసి మీ ప్రశ్నను మరోలా అడగండి."
+
+
+class TextSessionStore:
+    """In-memory session memories for the text API, evicted after `ttl` seconds idle or beyond `max_sessions`."""
+
+    def __init__(self, max_sessions: int = 10000, ttl: float = 1800.0):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._sessions: "OrderedDict[str, tuple[MemoryManager, asyncio.Lock, float]]" = OrderedDict()
+
+    def get(self, sid: str) -> tuple[MemoryManager, asyncio.Lock]:
+        now = time.monotonic()
+        entry = self._sessions.pop(sid, None)
+        if entry is None or now - entry[2] > self.ttl:
+            entry = (MemoryManager(), asyncio.Lock(), now)
+        memory, lock, _ = entry
+        self._sessions[sid] = (memory, lock, now)  # most recently used last
+
+        # Evict idle / excess sessions from the least recently used end
+        while self._sessions:
+            oldest, (_, old_lock, seen) = next(iter(self._sessions.items()))
+            if oldest == sid or (len(self._sessions) <= self.max_sessions and now - seen <= self.ttl):
+                break
+            if old_lock.locked():
+                break
+            self._sessions.popitem(last=False)
+        ACTIVE_SESSIONS.set(len(self._sessions), channel="text")
+        return memory, lock
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+class TextTurnService:
+    """
+    Request/response turns for text channels: no audio and no dependency on the
+    voice loop. Requests for different sessions run concurrently; requests for
+    the same session are serialized so its memory stays consistent.
+    """
+
+    def __init__(self, runner: TurnRunner | None = None, store: TextSessionStore | None = None):
+        self._runner = runner
+        self.store = store or TextSessionStore()
+
+    @property
+    def runner(self) -> TurnRunner:
+        # Created on first use so the dashboard still starts without planner credentials
+        if self._runner is None:
+            self._runner = TurnRunner()
+        return self._runner
+
+    async def handle(self, request: TurnRequest) -> TurnResponse:
+        session_id.set(request.session_id)
+        new_turn_id()
+        memory, lock = self.store.get(request.session_id)
+        async with lock:
+            for key, value in request.profile.model_dump(exclude_none=True).items():
+                memory.update_profile(key, value)
+            result = await self.runner.run(memory, request.text.strip())
+        if not result.reply:
+            # Nothing to say (e.g. an evaluation with no usable result); never answer with ""
+            result.reply, result.source = NO_REPLY, "fallback"
+        TURNS.inc(source="api")
+        logger.info("[API] turn intent=%s source=%s", result.intent, result.source)
+        return TurnResponse(
+            session_id=request.session_id,
+            reply=result.reply,
+            intent=result.intent,
+            source=result.source,
+            tools=result.tools,
+            profile=dict(memory.profile),
+        )
+
+
+router = APIRouter()
+text_service = TextTurnService()
+
+
+@router.post("/api/turn", response_model=TurnResponse)
+async def api_turn(request: TurnRequest):
+    """One text turn for SMS / IVR channels, independent of the voice loop."""
+    try:
+        return await text_service.handle(request)
+    except Overloaded as e:
+        raise HTTPException(
+            status_code=503,
+            detail={"error": "overloaded", "stage": e.stage, "reply": HOLD_PROMPT},
+            headers={"Retry-After": "2"},
+        )
@@ -7,7 +7,8 @@ const terminal = document.getElementById('terminal');
 const micButton = document.getElementById('mic-button');
 const textInput = document.getElementById('text-input');
 const textSendBtn = document.getElementById('text-send');
-const recordingIndicator = document.getElementById('recording-indicator');
+// Optional element: not every layout has a recording badge
+const recordingIndicator = document.getElementById('recording-indicator') || document.createElement('div');
 
 // WebSocket connection
 const ws = new WebSocket("ws://" + window.location.host + "/ws");
@@ -68,6 +69,18 @@ ws.onmessage = (event) => {
         else if (data.type === 'control') {
             handleControl(data.payload);
         }
+        else if (data.type === 'audio_start') {
+            audioPlayer.start(data.payload);
+        }
+        else if (data.type === 'audio_chunk') {
+            audioPlayer.append(data.payload);
+        }
+        else if (data.type === 'audio_end') {
+            audioPlayer.end(data.payload);
+        }
+        else if (data.type === 'audio_stop') {
+            audioPlayer.stop(data.payload);
+        }
     } catch (error) {
         console.error("Error parsing WebSocket message:", error);
     }
@@ -183,6 +196,119 @@ function scrollToBottom() {
     });
 }
 
+// Streamed TTS playback.
+// The server sends MP3 chunks (base64) as edge-tts produces them. With Media Source
+// Extensions playback starts on the first chunk; otherwise chunks are collected and
+// played once the utterance ends. The server is told when playback finishes so it
+// can move on to the next turn.
+function base64ToBytes(b64) {
+    const binary = atob(b64);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) {
+        bytes[i] = binary.charCodeAt(i);
+    }
+    return bytes;
+}
+
+const audioPlayer = {
+    id: null,
+    audio: null,
+    mediaSource: null,
+    sourceBuffer: null,
+    pending: [],
+    chunks: [],
+    ended: false,
+    mime: 'audio/mpeg',
+    useMse: false,
+
+    start(payload) {
+        this.reset();
+        this.id = payload.id;
+        this.mime = payload.mime || 'audio/mpeg';
+        this.useMse = typeof MediaSource !== 'undefined' && MediaSource.isTypeSupported(this.mime);
+        this.audio = new Audio();
+        this.audio.onended = () => this.finished();
+        if (this.useMse) {
+            this.mediaSource = new MediaSource();
+            this.audio.src = URL.createObjectURL(this.mediaSource);
+            this.mediaSource.addEventListener('sourceopen', () => {
+                this.sourceBuffer = this.mediaSource.addSourceBuffer(this.mime);
+                this.sourceBuffer.addEventListener('updateend', () => this.pump());
+                this.pump();
+            }, { once: true });
+            this.play();
+        }
+    },
+
+    append(payload) {
+        if (payload.id !== this.id) return;
+        const bytes = base64ToBytes(payload.data);
+        if (this.useMse) {
+            this.pending.push(bytes);
+            this.pump();
+        } else {
+            this.chunks.push(bytes);
+        }
+    },
+
+    end(payload) {
+        if (payload.id !== this.id) return;
+        this.ended = true;
+        if (this.useMse) {
+            this.pump();
+        } else {
+            this.audio.src = URL.createObjectURL(new Blob(this.chunks, { type: this.mime }));
+            this.play();
+        }
+    },
+
+    stop(payload) {
+        if (!payload || payload.id === this.id) {
+            this.reset();
+        }
+    },
+
+    pump() {
+        const sb = this.sourceBuffer;
+        if (!sb || sb.updating) return;
+        if (this.pending.length) {
+            sb.appendBuffer(this.pending.shift());
+        } else if (this.ended && this.mediaSource.readyState === 'open') {
+            this.mediaSource.endOfStream();
+        }
+    },
+
+    play() {
+        this.audio.play().catch((err) => {
+            // Autoplay blocked (no user gesture yet): don't keep the agent waiting
+            console.warn('Audio playback blocked:', err);
+            this.finished();
+        });
+    },
+
+    finished() {
+        if (this.id && ws.readyState === WebSocket.OPEN) {
+            ws.send(JSON.stringify({ type: 'playback_done', payload: this.id }));
+        }
+        this.reset();
+    },
+
+    reset() {
+        if (this.audio) {
+            this.audio.onended = null;
+            this.audio.pause();
+            if (this.audio.src) URL.revokeObjectURL(this.audio.src);
+        }
+        this.id = null;
+        this.audio = null;
+        this.mediaSource = null;
+        this.sourceBuffer = null;
+        this.pending = [];
+        this.chunks = [];
+        this.ended = false;
+    }
+};
+
 function handleControl(payload) {
     if (payload === 'listening_on') {
         isListening = true;
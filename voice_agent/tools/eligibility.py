@@ -1,4 +1,15 @@
+from typing import Any, Dict, Iterable, List, Set
 from .definitions import ToolOutput, EligibilityInput
+from ..utils.metrics import RULE_EVALUATIONS
+
+
+def reads(*fields: str):
+    """Declares which EligibilityInput fields a scheme rule depends on."""
+    def decorator(fn):
+        fn.reads = tuple(fields)
+        return fn
+    return decorator
+
 
 class EligibilityEngine:
     def check(self, input_data: EligibilityInput, scheme_id: str) -> ToolOutput:
@@ -18,8 +29,18 @@ class EligibilityEngine:
                 error=f"ఈ పథకం ({scheme_id}) కోసం స్పష్టమైన అర్హత నిబంధనలు ఇంకా నిర్వచించలేదు."
             )
 
+        RULE_EVALUATIONS.inc(scheme=scheme_id)
         return rule_method(input_data)
 
+    def scheme_ids(self) -> List[str]:
+        """Schemes that have rules defined."""
+        return [name[len("_check_"):] for name in dir(self) if name.startswith("_check_")]
+
+    def fields_for(self, scheme_id: str) -> tuple:
+        rule_method = getattr(self, f"_check_{scheme_id}", None)
+        return getattr(rule_method, "reads", ())
+
+    @reads("age", "income")
     def _check_aasara_pension(self, data: EligibilityInput) -> ToolOutput:
         # Rules: Age >= 57, Income limit (simplified)
         reasons = []
@@ -55,6 +76,7 @@ class EligibilityEngine:
             }
         )
 
+    @reads("land_acres")
     def _check_rythu_bandhu(self, data: EligibilityInput) -> ToolOutput:
         # Rules: Must own land
         if data.land_acres is None:
@@ -82,3 +104,55 @@ class EligibilityEngine:
                 "message": f"మీరు ఉన్న {data.land_acres} ఎకరాల భూమిపై రైతు బంధు సాయం పొందే అవకాశం ఉంది."
             }
         )
+
+
+class EligibilityCache:
+    """
+    Per-session eligibility results kept in step with the caller's profile.
+
+    Each rule declares the fields it reads (see `reads`); when a profile
+    field changes only the schemes that depend on it are re-evaluated, so
+    "am I eligible?" is answered from a ready result.
+    """
+
+    def __init__(self, engine: EligibilityEngine | None = None):
+        self.engine = engine or EligibilityEngine()
+        self.results: Dict[str, ToolOutput] = {}
+        self._dependents: Dict[str, Set[str]] = {}
+        for scheme_id in self.engine.scheme_ids():
+            for field in self.engine.fields_for(scheme_id):
+                self._dependents.setdefault(field, set()).add(scheme_id)
+
+    @staticmethod
+    def build_input(profile: Dict[str, Any]) -> EligibilityInput:
+        known = {k: v for k, v in profile.items() if k in EligibilityInput.model_fields and v is not None}
+        return EligibilityInput(**known)
+
+    def on_profile_change(self, input_data: EligibilityInput, changed_fields: Iterable[str]):
+        """`input_data` is the profile as the rules should see it (see MemoryManager.eligibility_input)."""
+        stale = set()
+        for field in changed_fields:
+            stale |= self._dependents.get(field, set())
+        if not stale:
+            return
+        for scheme_id in stale:
+            self.results[scheme_id] = self.engine.check(input_data, scheme_id)
+
+    def get(self, scheme_id: str) -> ToolOutput | None:
+        return self.results.get(scheme_id)
+
+    def summary(self) -> Dict[str, Any]:
+        """Compact view for the planner context."""
+        out = {}
+        for scheme_id, result in self.results.items():
+            data = result.data or {}
+            entry = {"status": data.get("status")}
+            if data.get("missing_fields"):
+                entry["missing"] = data["missing_fields"]
+            if data.get("reasons"):
+                entry["reasons"] = data["reasons"]
+            out[scheme_id] = entry
+        return out
+
+    def clear(self):
+        self.results = {}
@@ -0,0 +1,144 @@
+import asyncio
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Dict
+
+from .logger import logger
+from .metrics import ADMISSION_SHED, ADMISSION_WAIT_SECONDS, IN_FLIGHT, QUEUE_DEPTH
+
+# stage: (max concurrent, max waiting, max wait seconds)
+DEFAULT_LIMITS = {
+    "asr": (2, 4, 3.0),   # CPU-bound Whisper; more parallel decodes only slow each other down
+    "llm": (8, 16, 2.0),  # Groq rate limits / request timeouts
+    "tts": (8, 16, 2.0),  # edge-tts connections
+}
+
+# Played (from the prompt cache) when a turn is shed
+HOLD_PROMPT = "దయచేసి ఒక్క క్షణం ఆగండి. ప్రస్తుతం చాలా మంది మాట్లాడుతున్నారు, కొద్దిసేపట్లో మళ్ళీ ప్రయత్నించండి."
+
+
+class Overloaded(Exception):
+    """Raised when a stage sheds a request instead of queueing it."""
+
+    def __init__(self, stage: str, reason: str):
+        super().__init__(f"{stage} overloaded ({reason})")
+        self.stage = stage
+        self.reason = reason
+
+
+class StageLimiter:
+    """
+    Concurrency limit with a bounded FIFO wait queue for one pipeline stage.
+
+    A request beyond `max_concurrent` waits at most `max_wait` seconds; if
+    `max_waiting` requests are already queued, or the wait runs out, it is
+    shed with `Overloaded` so the caller can answer right away instead of
+    piling onto a saturated backend.
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_waiting: int, max_wait: float):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_waiting = max_waiting
+        self.max_wait = max_wait
+        self.active = 0
+        self._waiters: deque = deque()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def _shed(self, reason: str):
+        ADMISSION_SHED.inc(stage=self.name, reason=reason)
+        logger.warning("[ADMISSION] %s shed (%s): %d active, %d waiting", self.name, reason, self.active, self.waiting)
+        raise Overloaded(self.name, reason)
+
+    def _publish(self):
+        QUEUE_DEPTH.set(len(self._waiters), queue=self.name)
+        IN_FLIGHT.set(self.active, stage=self.name)
+
+    async def acquire(self):
+        if self.active < self.max_concurrent and not self._waiters:
+            self.active += 1
+            self._publish()
+            ADMISSION_WAIT_SECONDS.observe(0.0, stage=self.name)
+            return
+        if len(self._waiters) >= self.max_waiting:
+            self._shed("queue_full")
+
+        start = time.perf_counter()
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        self._publish()
+        try:
+            await asyncio.wait_for(future, self.max_wait)
+        except BaseException as e:
+            if future.done() and not future.cancelled():
+                self.release()  # a slot was handed over just as we gave up
+            if isinstance(e, asyncio.TimeoutError):
+                self._shed("deadline")
+            raise
+        finally:
+            try:
+                self._waiters.remove(future)
+            except ValueError:
+                pass
+            self._publish()
+        ADMISSION_WAIT_SECONDS.observe(time.perf_counter() - start, stage=self.name)
+
+    def release(self):
+        # Hand the slot straight to the oldest live waiter (keeps FIFO order)
+        while self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                self._publish()
+                return
+        self.active -= 1
+        self._publish()
+
+    @asynccontextmanager
+    async def slot(self):
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+
+class AdmissionController:
+    """Per-stage limiters, configured from ADMIT_<STAGE>_CONCURRENCY / _QUEUE / _WAIT."""
+
+    def __init__(self):
+        self.enabled = os.getenv("ADMISSION", "1").lower() not in ("0", "false", "off")
+        self.stages: Dict[str, StageLimiter] = {}
+        for name, (concurrency, waiting, wait) in DEFAULT_LIMITS.items():
+            prefix = f"ADMIT_{name.upper()}_"
+            self.stages[name] = StageLimiter(
+                name,
+                int(os.getenv(prefix + "CONCURRENCY", concurrency)),
+                int(os.getenv(prefix + "QUEUE", waiting)),
+                float(os.getenv(prefix + "WAIT", wait)),
+            )
+
+    def stage(self, name: str):
+        """`async with admission.stage("llm"): ...` - raises Overloaded when shed."""
+        if not self.enabled:
+            return _UNLIMITED
+        return self.stages[name].slot()
+
+
+class _Unlimited:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+_UNLIMITED = _Unlimited()
+
+# Global controller shared by every session in this process
+admission = AdmissionController()
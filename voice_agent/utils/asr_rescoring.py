@@ -0,0 +1,159 @@
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..tools.knowledge import SCHEMES_DB
+
+# Words callers use when giving profile details (age, income, land, occupation)
+PROFILE_VOCABULARY = [
+    "వయస్సు", "సంవత్సరాలు", "ఏళ్లు", "ఆదాయం", "లక్ష", "లక్షలు", "వేలు", "రూపాయలు",
+    "ఎకరం", "ఎకరాలు", "భూమి", "వ్యవసాయం", "రైతు", "కూలీ", "పెన్షన్", "పథకం", "పథకాలు",
+    "అర్హత", "దరఖాస్తు", "వివాహం", "ఆధార్", "అవును", "కాదు",
+]
+
+_PUNCTUATION = " .,?!।'\"-"
+
+
+def _normalize(token: str) -> str:
+    return token.strip().strip(_PUNCTUATION)
+
+
+@dataclass
+class WordHypothesis:
+    """One recognized word with faster-whisper's timing and confidence."""
+    text: str
+    probability: float
+    start: float = 0.0
+    end: float = 0.0
+    corrected_from: Optional[str] = None
+
+
+@dataclass
+class RescoredTranscript:
+    text: str
+    quality: float
+    words: List[WordHypothesis] = field(default_factory=list)
+    # Words still too uncertain after rescoring; only these need confirming
+    uncertain: List[WordHypothesis] = field(default_factory=list)
+    # Whisper size that produced this transcript ("tiny" / "small")
+    tier: str = ""
+
+    @property
+    def corrections(self) -> List[WordHypothesis]:
+        return [w for w in self.words if w.corrected_from is not None]
+
+    @property
+    def needs_confirmation(self) -> bool:
+        return bool(self.uncertain)
+
+    @property
+    def confirmation_slot(self) -> Optional[WordHypothesis]:
+        """The single least-confident word to ask the caller about."""
+        if not self.uncertain:
+            return None
+        return min(self.uncertain, key=lambda w: w.probability)
+
+
+def build_lexicon(profile: Optional[Dict[str, Any]] = None) -> List[str]:
+    """Scheme names (whole and per word), profile vocabulary and known profile values."""
+    terms = set(PROFILE_VOCABULARY)
+    for scheme in SCHEMES_DB.values():
+        name = scheme["name"]
+        terms.add(name)
+        terms.add(name.replace(" ", ""))
+        terms.update(name.split())
+    for value in (profile or {}).values():
+        if isinstance(value, str) and value.strip():
+            terms.add(value.strip())
+    return sorted(terms)
+
+
+class LexiconRescorer:
+    """
+    Fixes likely misrecognitions of domain words using word-level probabilities.
+
+    A word below `low_prob` is compared with the domain lexicon (alone and
+    joined with its neighbour, since Whisper often splits compound names);
+    a close enough match replaces it. Words that stay below `confirm_prob`
+    are reported as uncertain so the agent confirms only that slot instead
+    of the whole sentence.
+    """
+
+    def __init__(self, low_prob: float = 0.6, confirm_prob: float = 0.4, min_similarity: float = 0.7):
+        self.low_prob = low_prob
+        self.confirm_prob = confirm_prob
+        self.min_similarity = min_similarity
+
+    def _best_match(self, token: str, lexicon: Iterable[str]) -> tuple[Optional[str], float]:
+        best, best_score = None, 0.0
+        for term in lexicon:
+            # Cheap length filter before the O(n*m) ratio
+            if abs(len(term) - len(token)) > max(2, len(term) // 2):
+                continue
+            score = SequenceMatcher(None, token, term).ratio()
+            if score > best_score:
+                best, best_score = term, score
+        return best, best_score
+
+    def rescore(
+        self,
+        words: List[WordHypothesis],
+        language_probability: float = 1.0,
+        profile: Optional[Dict[str, Any]] = None,
+    ) -> RescoredTranscript:
+        lexicon = build_lexicon(profile)
+        lexicon_set = set(lexicon)
+        out: List[WordHypothesis] = []
+
+        i = 0
+        while i < len(words):
+            word = words[i]
+            token = _normalize(word.text)
+            if not token or word.probability >= self.low_prob or token in lexicon_set:
+                out.append(word)
+                i += 1
+                continue
+
+            # Try merging with the next word first ("రైతు బందు" -> "రైతు బంధు")
+            if i + 1 < len(words):
+                nxt = words[i + 1]
+                pair = f"{token} {_normalize(nxt.text)}"
+                term, score = self._best_match(pair, (t for t in lexicon if " " in t))
+                if term and score >= self.min_similarity and term != pair:
+                    out.append(WordHypothesis(
+                        text=term,
+                        probability=max(score, word.probability, nxt.probability),
+                        start=word.start,
+                        end=nxt.end,
+                        corrected_from=f"{word.text.strip()} {nxt.text.strip()}",
+                    ))
+                    i += 2
+                    continue
+
+            term, score = self._best_match(token, lexicon)
+            if term and score >= self.min_similarity:
+                out.append(WordHypothesis(
+                    text=term,
+                    probability=max(score, word.probability),
+                    start=word.start,
+                    end=word.end,
+                    corrected_from=word.text.strip(),
+                ))
+            else:
+                out.append(word)
+            i += 1
+
+        text = " ".join(_normalize(w.text) if w.corrected_from else w.text.strip() for w in out).strip()
+        uncertain = [
+            w for w in out
+            if w.corrected_from is None
+            and w.probability < self.confirm_prob
+            and len(_normalize(w.text)) > 1
+        ]
+
+        quality = 0.0
+        if out:
+            mean_prob = sum(w.probability for w in out) / len(out)
+            quality = float(language_probability) * mean_prob
+
+        return RescoredTranscript(text=text, quality=quality, words=out, uncertain=uncertain)
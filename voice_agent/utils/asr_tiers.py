@@ -0,0 +1,155 @@
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import numpy as np
+
+from .asr_rescoring import LexiconRescorer, RescoredTranscript, WordHypothesis
+from .logger import logger
+from .metrics import ASR_DECODES, QUEUE_DEPTH, span
+
+TIERS = ("tiny", "small")
+
+# Domain prompt to bias towards govt schemes
+KEYWORDS_PROMPT = (
+    "నమస్కారం, తెలంగాణ ప్రభుత్వం సంక్షేమ పథకాలు, రైతు బంధు, ఆసరా పెన్షన్, "
+    "కళ్యాణ లక్ష్మి, విత్తనాలు, ఎకరాలు, ఆదాయం, వయస్సు."
+)
+
+
+def speech_seconds(audio: np.ndarray, sample_rate: int, threshold: float = 0.01, frame_ms: int = 20) -> float:
+    """Length from the first to the last voiced 20 ms frame (a fixed recording window is mostly silence)."""
+    frame = max(1, sample_rate * frame_ms // 1000)
+    usable = len(audio) - len(audio) % frame
+    if usable <= 0:
+        return 0.0
+    energy = np.abs(audio[:usable]).reshape(-1, frame).mean(axis=1)
+    voiced = np.flatnonzero(energy >= threshold)
+    if voiced.size == 0:
+        return 0.0
+    return (voiced[-1] - voiced[0] + 1) * frame / sample_rate
+
+
+@dataclass
+class TierDecision:
+    tier: str
+    reason: str
+
+
+class AsrTierPolicy:
+    """
+    Chooses which Whisper size decodes an utterance.
+
+    "adaptive" decodes with tiny first when the ASR queue is deep or the
+    utterance is short, and re-decodes with small only if tiny's quality
+    score is below `redecode_quality`. "small" and "tiny" pin one tier.
+    """
+
+    def __init__(
+        self,
+        mode: Optional[str] = None,
+        short_seconds: Optional[float] = None,
+        busy_depth: Optional[int] = None,
+        redecode_quality: Optional[float] = None,
+    ):
+        self.mode = (mode or os.getenv("ASR_TIER_POLICY", "adaptive")).lower()
+        self.short_seconds = short_seconds if short_seconds is not None else float(os.getenv("ASR_SHORT_SECONDS", "1.5"))
+        self.busy_depth = busy_depth if busy_depth is not None else int(os.getenv("ASR_BUSY_DEPTH", "2"))
+        self.redecode_quality = (
+            redecode_quality if redecode_quality is not None else float(os.getenv("ASR_REDECODE_QUALITY", "0.6"))
+        )
+
+    def required_tiers(self) -> tuple:
+        return TIERS if self.mode == "adaptive" else (self.mode,)
+
+    def first_tier(self, speech_s: float, queue_depth: int) -> TierDecision:
+        if self.mode != "adaptive":
+            return TierDecision(self.mode, "fixed")
+        if queue_depth >= self.busy_depth:
+            return TierDecision("tiny", "busy")
+        if speech_s <= self.short_seconds:
+            return TierDecision("tiny", "short")
+        return TierDecision("small", "default")
+
+    def should_redecode(self, tier: str, quality: float) -> bool:
+        return self.mode == "adaptive" and tier == "tiny" and quality < self.redecode_quality
+
+
+class TieredTranscriber:
+    """
+    Runs faster-whisper at the tier the policy picks, rescores the words and
+    re-decodes with the larger model when the fast pass is not good enough.
+
+    `models` maps tier name to a loaded WhisperModel; a missing tier falls
+    back to whichever model is loaded.
+    """
+
+    def __init__(self, models: Dict[str, object], policy: AsrTierPolicy, rescorer: LexiconRescorer,
+                 language: str = "te", sample_rate: int = 16000):
+        self.models = models
+        self.policy = policy
+        self.rescorer = rescorer
+        self.language = language
+        self.sample_rate = sample_rate
+        self._inflight = 0
+        self._lock = threading.Lock()
+
+    def _model_for(self, tier: str):
+        if tier in self.models:
+            return tier, self.models[tier]
+        if self.models:
+            name = next(iter(self.models))
+            return name, self.models[name]
+        return tier, None
+
+    def _decode(self, tier: str, reason: str, audio: np.ndarray, profile: Optional[dict]) -> RescoredTranscript:
+        tier, model = self._model_for(tier)
+        if model is None:
+            return RescoredTranscript(text="", quality=0.0, tier=tier)
+        ASR_DECODES.inc(tier=tier, reason=reason)
+
+        with span(f"asr.decode.{tier}"):
+            segments, info = model.transcribe(
+                audio,
+                beam_size=3,
+                language=self.language,
+                initial_prompt=KEYWORDS_PROMPT,
+                condition_on_previous_text=False,
+                vad_filter=True,
+                word_timestamps=True,
+            )
+            words = []
+            for segment in segments:
+                for w in segment.words or []:
+                    words.append(WordHypothesis(text=w.word, probability=w.probability, start=w.start, end=w.end))
+
+        if not words:
+            return RescoredTranscript(text="", quality=0.0, tier=tier)
+
+        # language_probability is in [0,1]
+        lang_prob = getattr(info, "language_probability", 0.0) or 0.0
+        result = self.rescorer.rescore(words, language_probability=lang_prob, profile=profile)
+        result.tier = tier
+        return result
+
+    def transcribe(self, audio: np.ndarray, profile: Optional[dict] = None) -> RescoredTranscript:
+        """`audio` is mono float32 in [-1, 1] at `sample_rate`."""
+        with self._lock:
+            queue_depth = self._inflight
+            self._inflight += 1
+            QUEUE_DEPTH.set(self._inflight, queue="asr")
+        try:
+            decision = self.policy.first_tier(speech_seconds(audio, self.sample_rate), queue_depth)
+            result = self._decode(decision.tier, decision.reason, audio, profile)
+
+            if "small" in self.models and self.policy.should_redecode(result.tier, result.quality):
+                logger.info("[ASR] %s quality %.2f too low, re-decoding with small", result.tier, result.quality)
+                retry = self._decode("small", "redecode", audio, profile)
+                if retry.quality >= result.quality:
+                    result = retry
+            return result
+        finally:
+            with self._lock:
+                self._inflight -= 1
+                QUEUE_DEPTH.set(self._inflight, queue="asr")
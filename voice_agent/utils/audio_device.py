@@ -0,0 +1,14 @@
+try:
+    import sounddevice
+    _unavailable = None
+except OSError as e:
+    # PortAudio is missing: the server still runs for browser audio, the text API and load tests
+    sounddevice = None
+    _unavailable = e
+
+
+def require_sounddevice():
+    """The sounddevice module; raises OSError when this machine has no PortAudio."""
+    if sounddevice is None:
+        raise OSError(f"Server audio device unavailable: {_unavailable}")
+    return sounddevice
@@ -0,0 +1,155 @@
+import asyncio
+import io
+import threading
+
+import av
+import numpy as np
+
+from .audio_device import require_sounddevice
+from .logger import logger
+
+# edge-tts voices are 24 kHz mono
+PLAYBACK_SAMPLE_RATE = 24000
+
+
+class PcmBuffer:
+    """
+    Mono float32 samples for one clip. The backing array only grows, so once
+    it has held the longest reply no further allocation happens per utterance.
+    """
+
+    def __init__(self, capacity: int = PLAYBACK_SAMPLE_RATE * 10):
+        self._data = np.zeros(capacity, dtype=np.float32)
+        self.frames = 0
+
+    def clear(self):
+        self.frames = 0
+
+    def append(self, samples: np.ndarray):
+        end = self.frames + len(samples)
+        if end > len(self._data):
+            grown = np.zeros(max(end, 2 * len(self._data)), dtype=np.float32)
+            grown[:self.frames] = self._data[:self.frames]
+            self._data = grown
+        self._data[self.frames:end] = samples
+        self.frames = end
+
+    @property
+    def samples(self) -> np.ndarray:
+        return self._data[:self.frames]
+
+    @property
+    def seconds(self) -> float:
+        return self.frames / PLAYBACK_SAMPLE_RATE
+
+
+def decode_into(data: bytes, buffer: PcmBuffer, sample_rate: int = PLAYBACK_SAMPLE_RATE) -> int:
+    """Decodes encoded audio (MP3, WAV, ...) held in memory into `buffer`. Returns the frame count."""
+    buffer.clear()
+    resampler = av.AudioResampler(format="flt", layout="mono", rate=sample_rate)
+    with av.open(io.BytesIO(data), mode="r") as container:
+        for frame in container.decode(audio=0):
+            for out in resampler.resample(frame):
+                buffer.append(out.to_ndarray().reshape(-1))
+    for out in resampler.resample(None):
+        buffer.append(out.to_ndarray().reshape(-1))
+    return buffer.frames
+
+
+class PcmPlayer:
+    """
+    Plays PcmBuffers through one long-lived output stream.
+
+    The device callback copies the loaded clip block by block and outputs
+    silence between clips, so the device is opened once per process. When the
+    last frame has been handed to the device the callback fires an event that
+    `play` awaits - no polling. `stop` cuts the clip short (barge-in).
+    """
+
+    def __init__(self, sample_rate: int = PLAYBACK_SAMPLE_RATE, blocksize: int = 480, stream_factory=None):
+        self.sample_rate = sample_rate
+        self.blocksize = blocksize
+        # sounddevice.OutputStream by default; anything with the same constructor/callback contract works
+        self._stream_factory = stream_factory
+        self._stream = None
+        self._lock = threading.Lock()
+        self._source: np.ndarray | None = None
+        self._pos = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._done: asyncio.Event | None = None
+        self.finished = threading.Event()
+
+    def _open(self):
+        if self._stream is not None:
+            return
+        factory = self._stream_factory
+        if factory is None:
+            factory = require_sounddevice().OutputStream
+        self._stream = factory(
+            samplerate=self.sample_rate,
+            channels=1,
+            dtype="float32",
+            blocksize=self.blocksize,
+            callback=self._callback,
+        )
+        self._stream.start()
+
+    async def play(self, buffer: PcmBuffer):
+        """Plays the buffer's samples and returns once they have been played (or `stop` was called)."""
+        if not buffer.frames:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._open()
+        done = asyncio.Event()
+        with self._lock:
+            self._finish_locked()
+            self._source = buffer.samples
+            self._pos = 0
+            self._done = done
+            self.finished.clear()
+        try:
+            await done.wait()
+            # The last block is still in the device queue
+            latency = getattr(self._stream, "latency", 0.0)
+            if isinstance(latency, float) and latency > 0 and self._pos >= len(buffer.samples):
+                await asyncio.sleep(latency)
+        except asyncio.CancelledError:
+            self.stop()
+            raise
+
+    def stop(self):
+        with self._lock:
+            self._finish_locked()
+
+    def close(self):
+        self.stop()
+        if self._stream is None:
+            return
+        try:
+            self._stream.stop()
+            self._stream.close()
+        except Exception as e:
+            logger.warning(f"Audio output close failed: {e}")
+        self._stream = None
+
+    def _finish_locked(self):
+        if self._source is None:
+            return
+        self._source = None
+        self.finished.set()
+        done, self._done = self._done, None
+        if done is not None:
+            self._loop.call_soon_threadsafe(done.set)
+
+    def _callback(self, outdata, frames, time_info, status):
+        with self._lock:
+            source = self._source
+            if source is None:
+                outdata.fill(0)
+                return
+            n = min(frames, len(source) - self._pos)
+            outdata[:n, 0] = source[self._pos:self._pos + n]
+            outdata[n:] = 0
+            self._pos += n
+            if self._pos >= len(source):
+                self._finish_locked()
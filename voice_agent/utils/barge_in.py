@@ -0,0 +1,135 @@
+import asyncio
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from .audio_device import require_sounddevice
+from .logger import logger
+
+
+class BargeInMonitor:
+    """
+    Watches the microphone while the agent is thinking or speaking and flags
+    the moment the caller starts talking (simple frame-energy VAD).
+
+    Once triggered it keeps capturing (with a short pre-roll so the first
+    syllable is not lost) until the caller pauses or `max_capture_seconds`
+    is reached, so the interruption itself becomes the next user turn.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        frame_ms: int = 20,
+        energy_threshold: float = 0.02,
+        min_speech_frames: int = 5,
+        preroll_ms: int = 300,
+        end_silence_ms: int = 800,
+        max_capture_seconds: float = 6.0,
+    ):
+        self.sample_rate = sample_rate
+        self.frame_size = int(sample_rate * frame_ms / 1000)
+        self.frame_seconds = frame_ms / 1000
+        # Higher than the listen() silence gate because the agent's own voice leaks into the mic
+        self.energy_threshold = energy_threshold
+        self.min_speech_frames = min_speech_frames
+        self.end_silence_frames = max(1, end_silence_ms // frame_ms)
+        self.max_capture_frames = int(max_capture_seconds * 1000 / frame_ms)
+
+        self._preroll = deque(maxlen=max(1, preroll_ms // frame_ms))
+        self._captured: list[np.ndarray] = []
+        self._speech_run = 0
+        self._silence_run = 0
+        self._stream = None  # sounddevice.InputStream while active
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._triggered_async: asyncio.Event | None = None
+
+        self.triggered = threading.Event()
+        self.capture_done = threading.Event()
+        # perf_counter() timestamps used for latency reporting
+        self.onset_time = 0.0
+        self.trigger_time = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self._stream is not None
+
+    def start(self):
+        """Opens the input stream. Must be called from the event loop thread."""
+        if self._stream is not None:
+            # Still open only when an interruption was captured but never listened to
+            # (a typed turn went first): drop it so the new turn is not cut off at once
+            logger.info("[BARGE-IN] Discarding unused capture from the previous turn")
+            self.stop()
+        self._loop = asyncio.get_running_loop()
+        self._triggered_async = asyncio.Event()
+        self._preroll.clear()
+        self._captured = []
+        self._speech_run = 0
+        self._silence_run = 0
+        self.triggered.clear()
+        self.capture_done.clear()
+        self._stream = require_sounddevice().InputStream(
+            samplerate=self.sample_rate,
+            channels=1,
+            dtype="int16",
+            blocksize=self.frame_size,
+            callback=self._callback,
+        )
+        self._stream.start()
+
+    def stop(self):
+        if self._stream is None:
+            return
+        try:
+            self._stream.stop()
+            self._stream.close()
+        except Exception as e:
+            logger.warning(f"Barge-in monitor stop failed: {e}")
+        self._stream = None
+        self.capture_done.set()
+
+    async def wait(self):
+        """Resolves as soon as caller speech is detected."""
+        await self._triggered_async.wait()
+
+    def take_capture(self, timeout: float = 8.0) -> np.ndarray | None:
+        """
+        Blocks until the interrupting utterance is complete, stops the stream
+        and returns the captured int16 audio (shape [n, 1]).
+        """
+        if not self.triggered.is_set():
+            return None
+        self.capture_done.wait(timeout)
+        self.stop()
+        self.triggered.clear()
+        captured, self._captured = self._captured, []
+        if not captured:
+            return None
+        return np.concatenate(captured)
+
+    def _callback(self, indata, frames, time_info, status):
+        frame = indata.copy()
+        energy = float(np.mean(np.abs(frame.astype("float32") / 32768.0)))
+        voiced = energy >= self.energy_threshold
+
+        if self.triggered.is_set():
+            if self.capture_done.is_set():
+                return
+            self._captured.append(frame)
+            self._silence_run = 0 if voiced else self._silence_run + 1
+            if self._silence_run >= self.end_silence_frames or len(self._captured) >= self.max_capture_frames:
+                self.capture_done.set()
+            return
+
+        self._preroll.append(frame)
+        self._speech_run = self._speech_run + 1 if voiced else 0
+        if self._speech_run >= self.min_speech_frames:
+            now = time.perf_counter()
+            self.trigger_time = now
+            self.onset_time = now - self._speech_run * self.frame_seconds
+            self._captured = list(self._preroll)
+            self.triggered.set()
+            self._loop.call_soon_threadsafe(self._triggered_async.set)
@@ -0,0 +1,21 @@
+from collections import deque
+
+
+class LatencyTracker:
+    """Rolling window of recent latencies (seconds) with quantile lookup."""
+
+    def __init__(self, window: int = 200):
+        self.samples = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def quantile(self, q: float) -> float | None:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+        return ordered[index]
@@ -1,13 +1,39 @@
+import atexit
+import contextvars
+import json
 import logging
+import os
+import queue
 import sys
+import threading
+import uuid
 from colorama import Fore, Style, init
 
 # Initialize colorama
 init(autoreset=True)
 
+# Correlation ids stamped on every record; asyncio tasks and to_thread calls inherit them
+session_id = contextvars.ContextVar("session_id", default="-")
+turn_id = contextvars.ContextVar("turn_id", default="-")
+
+
+def new_session_id() -> str:
+    """Starts a new session id in the current context and returns it."""
+    value = uuid.uuid4().hex[:8]
+    session_id.set(value)
+    return value
+
+
+def new_turn_id() -> str:
+    """Starts a new turn id in the current context and returns it."""
+    value = uuid.uuid4().hex[:8]
+    turn_id.set(value)
+    return value
+
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter to add colors to log levels"""
-    
+
     COLORS = {
         logging.DEBUG: Fore.CYAN,
         logging.INFO: Fore.GREEN,
@@ -21,18 +47,124 @@ class ColoredFormatter(logging.Formatter):
         message = super().format(record)
         return f"{color}{message}{Style.RESET_ALL}"
 
-def setup_logger(name="VoiceAgent", level=logging.INFO):
-    """Sets up a logger with colored console output"""
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; `extra={"fields": {...}}` adds structured fields."""
+
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "session": getattr(record, "session_id", "-"),
+            "turn": getattr(record, "turn_id", "-"),
+            "msg": record.getMessage(),
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            entry.update(fields)
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class BackgroundWriter:
+    """
+    Formats and writes log records on a daemon thread.
+
+    Records are drained in batches and each batch is written with a single
+    write + flush. When the queue is full, records are dropped (and the count
+    reported) rather than blocking the caller.
+    """
+
+    def __init__(self, stream, formatter: logging.Formatter, max_queue: int = 10000, batch_size: int = 256):
+        self.stream = stream
+        self.formatter = formatter
+        self.batch_size = batch_size
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self._stop = object()
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _format(self, record) -> str:
+        try:
+            return self.formatter.format(record)
+        except Exception as e:
+            return f"<unformattable log record {record.msg!r}: {e}>"
+
+    def _run(self):
+        reported_drops = 0
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stopping = self._stop in batch
+            lines = [self._format(r) for r in batch if r is not self._stop]
+            if self.dropped != reported_drops:
+                lines.append(f"<log writer dropped {self.dropped - reported_drops} records: queue full>")
+                reported_drops = self.dropped
+            if lines:
+                try:
+                    self.stream.write("\n".join(lines) + "\n")
+                    self.stream.flush()
+                except Exception:
+                    pass
+            if stopping:
+                return
+
+    def close(self, timeout: float = 2.0):
+        """Flushes whatever is queued and stops the thread."""
+        if self._thread.is_alive():
+            self.queue.put(self._stop)
+            self._thread.join(timeout)
+
+
+class QueueingHandler(logging.Handler):
+    """Stamps the session/turn ids and hands the record to the writer thread without blocking."""
+
+    def __init__(self, writer: BackgroundWriter):
+        super().__init__()
+        self.writer = writer
+
+    def emit(self, record):
+        record.session_id = session_id.get()
+        record.turn_id = turn_id.get()
+        self.writer.submit(record)
+
+
+def setup_logger(name="VoiceAgent", level=None):
+    """
+    Sets up the shared logger. Output goes through a background writer:
+    JSON lines by default, colored text with LOG_FORMAT=console (development).
+    """
     logger = logging.getLogger(name)
-    logger.setLevel(level)
+    logger.setLevel(level or os.getenv("LOG_LEVEL", "INFO").upper())
 
-    # Console Handler
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(ColoredFormatter("%(asctime)s - [%(levelname)s] - %(message)s", datefmt="%H:%M:%S"))
-    
     if not logger.handlers:
-        logger.addHandler(handler)
-        
+        if os.getenv("LOG_FORMAT", "json").lower() == "console":
+            formatter = ColoredFormatter(
+                "%(asctime)s - [%(levelname)s] - [%(session_id)s/%(turn_id)s] %(message)s", datefmt="%H:%M:%S"
+            )
+        else:
+            formatter = JsonFormatter()
+        log_file = os.getenv("LOG_FILE")
+        stream = open(log_file, "a", encoding="utf-8") if log_file else sys.stdout
+
+        writer = BackgroundWriter(stream, formatter)
+        atexit.register(writer.close)
+        logger.addHandler(QueueingHandler(writer))
+
     return logger
 
 # Global logger instance
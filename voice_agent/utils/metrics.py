@@ -0,0 +1,274 @@
+import os
+import time
+import threading
+from bisect import bisect_left
+from typing import Dict, Tuple, List, Optional
+
+# Latency buckets (seconds) sized for voice turns: sub-ms tool calls up to multi-second ASR/LLM/TTS.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Optional[Dict[str, str]]) -> LabelKey:
+    if not labels:
+        return ()
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key)
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    body = ",".join(f'{k}="{v}"' for k, v in pairs)
+    return "{" + body + "}"
+
+
+class Counter:
+    """Monotonically increasing value, optionally split by labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels):
+        if not registry.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(_label_key(labels), 0.0)
+
+    def total(self, **labels) -> float:
+        """Sum over every label set that matches the given labels."""
+        want = {k: str(v) for k, v in labels.items()}
+        return sum(
+            v for key, v in list(self._values.items())
+            if all(dict(key).get(k) == w for k, w in want.items())
+        )
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(k)} {v}" for k, v in items]
+
+
+class Gauge:
+    """Value that can go up and down (active sessions, queue depth)."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def set(self, value: float, **labels):
+        if not registry.enabled:
+            return
+        with self._lock:
+            self._values[_label_key(labels)] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels):
+        if not registry.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def value(self, **labels) -> float:
+        return self._values.get(_label_key(labels), 0.0)
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(k)} {v}" for k, v in items]
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus exposition layout."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        # label key -> [per-bucket counts..., +Inf count], sum
+        self._counts: Dict[LabelKey, List[int]] = {}
+        self._sums: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        if not registry.enabled:
+            return
+        key = _label_key(labels)
+        idx = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[idx] += 1
+            self._sums[key] += value
+
+    def count(self, **labels) -> int:
+        return sum(self._counts.get(_label_key(labels), ()))
+
+    def collect(self) -> List[str]:
+        lines = []
+        with self._lock:
+            items = [(k, list(c), self._sums[k]) for k, c in self._counts.items()]
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, c in zip(self.buckets, counts):
+                cumulative += c
+                lines.append(f"{self.name}_bucket{_format_labels(key, ('le', repr(bound)))} {cumulative}")
+            cumulative += counts[-1]
+            lines.append(f"{self.name}_bucket{_format_labels(key, ('le', '+Inf'))} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Process-wide metric registry.
+    When disabled, every record call returns after a single attribute check
+    and `span()` hands back a shared no-op context manager.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._metrics: Dict[str, object] = {}
+
+    def _register(self, metric):
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        return self._register(Counter(name, help_text))
+
+    def gauge(self, name: str, help_text: str) -> Gauge:
+        return self._register(Gauge(name, help_text))
+
+    def histogram(self, name: str, help_text: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, buckets))
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry(enabled=os.getenv("VOICE_AGENT_METRICS", "1").lower() not in ("0", "false", "off"))
+
+# Core agent metrics
+SPAN_SECONDS = registry.histogram(
+    "voice_agent_span_seconds", "Duration of instrumented calls (ASR, TTS, planner, executor, evaluator)."
+)
+SPAN_ERRORS = registry.counter(
+    "voice_agent_span_errors_total", "Instrumented calls that raised an exception."
+)
+STATE_SECONDS = registry.histogram(
+    "voice_agent_state_seconds", "Time spent in each agent state before transitioning."
+)
+STATE_TRANSITIONS = registry.counter(
+    "voice_agent_state_transitions_total", "Agent state transitions."
+)
+TURNS = registry.counter("voice_agent_turns_total", "Completed user turns by input source.")
+ACTIVE_SESSIONS = registry.gauge("voice_agent_active_sessions", "Open sessions by channel (dashboard websockets, text API).")
+QUEUE_DEPTH = registry.gauge("voice_agent_queue_depth", "Pending items waiting to be processed.")
+CONFIRMATIONS = registry.counter(
+    "voice_agent_asr_confirmations_total", "Voice turns where an uncertain word was (asked) or was not (skipped) confirmed."
+)
+LLM_CALLS = registry.counter("voice_agent_llm_calls_total", "Planner LLM calls by purpose (plan, summarize).")
+LLM_TOKENS = registry.counter("voice_agent_llm_tokens_total", "Planner LLM tokens by kind (prompt, completion).")
+ASR_DECODES = registry.counter(
+    "voice_agent_asr_decodes_total", "Whisper decodes by model tier and why that tier was chosen."
+)
+LLM_BACKEND_SECONDS = registry.histogram(
+    "voice_agent_llm_backend_seconds", "Successful planner LLM call latency by backend (primary, fallback)."
+)
+PLANNER_HEDGES = registry.counter(
+    "voice_agent_planner_hedges_total", "Hedged planner requests by winner (primary, fallback, none)."
+)
+RESPONSES = registry.counter(
+    "voice_agent_responses_total", "Agent replies by source (planner, template, llm_summary, ask_user)."
+)
+TOOL_CALLS = registry.counter(
+    "voice_agent_tool_calls_total", "Executor tool calls by tool and source (engine, cache)."
+)
+RULE_EVALUATIONS = registry.counter("voice_agent_rule_evaluations_total", "Eligibility rule evaluations by scheme.")
+BARGE_IN_SECONDS = registry.histogram(
+    "voice_agent_barge_in_seconds",
+    "Caller speech onset to barge-in detection (stage=detect) and to playback stopped (stage=stop).",
+    buckets=(0.02, 0.05, 0.1, 0.15, 0.2, 0.3, 0.5, 1.0, 2.0),
+)
+IN_FLIGHT = registry.gauge("voice_agent_in_flight", "Requests currently holding an admission slot, by stage.")
+ADMISSION_SHED = registry.counter(
+    "voice_agent_admission_shed_total", "Requests shed by admission control, by stage and reason (queue_full, deadline)."
+)
+ADMISSION_WAIT_SECONDS = registry.histogram(
+    "voice_agent_admission_wait_seconds", "Time spent queued for an admission slot, by stage."
+)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _TimedSpan:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        SPAN_SECONDS.observe(time.perf_counter() - self.start, span=self.name)
+        if exc_type is not None and issubclass(exc_type, Exception):
+            SPAN_ERRORS.inc(span=self.name)
+        return False
+
+
+def span(name: str):
+    """
+    Times the enclosed block into `voice_agent_span_seconds{span=name}`.
+    Works for both sync and `await` code (it only measures wall time).
+    """
+    if not registry.enabled:
+        return _NOOP_SPAN
+    return _TimedSpan(name)
@@ -0,0 +1,94 @@
+import asyncio
+import io
+import os
+import wave
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+import edge_tts
+import numpy as np
+
+from .logger import logger
+
+
+class TTSProducer(ABC):
+    """
+    Source of synthesized speech. `stream(text)` yields encoded audio bytes
+    (of type `mime`) as they are produced; callers decide whether to forward,
+    cache or decode them.
+    """
+
+    mime = "audio/mpeg"
+    # Rough encoded size of one second of audio, used to bound playback waits
+    bytes_per_second = 6000.0
+
+    @abstractmethod
+    def stream(self, text: str) -> AsyncIterator[bytes]:
+        """Implemented as an async generator."""
+
+
+class EdgeTTSProducer(TTSProducer):
+    """Microsoft Edge neural voices (audio-24khz-48kbitrate-mono-mp3)."""
+
+    mime = "audio/mpeg"
+    bytes_per_second = 48000 / 8
+
+    def __init__(self, voice: str = "te-IN-ShrutiNeural"):
+        self.voice = voice
+
+    async def stream(self, text: str) -> AsyncIterator[bytes]:
+        communicate = edge_tts.Communicate(text, self.voice)
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                yield chunk["data"]
+
+
+class FakeTTSProducer(TTSProducer):
+    """
+    Offline producer for benches and tests: a 16-bit mono WAV tone whose
+    length follows the text, yielded in chunks with an optional per-chunk
+    delay to mimic network synthesis.
+    """
+
+    mime = "audio/wav"
+
+    def __init__(
+        self,
+        sample_rate: int = 24000,
+        seconds_per_char: float = 0.06,
+        chunk_bytes: int = 4096,
+        chunk_delay: float = 0.0,
+    ):
+        self.sample_rate = sample_rate
+        self.seconds_per_char = seconds_per_char
+        self.chunk_bytes = chunk_bytes
+        self.chunk_delay = chunk_delay
+        self.bytes_per_second = sample_rate * 2.0
+
+    def render(self, text: str) -> bytes:
+        seconds = max(0.2, len(text) * self.seconds_per_char)
+        t = np.arange(int(seconds * self.sample_rate)) / self.sample_rate
+        tone = (0.2 * np.sin(2 * np.pi * 220.0 * t) * 32767).astype("<i2")
+        out = io.BytesIO()
+        with wave.open(out, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(self.sample_rate)
+            wav.writeframes(tone.tobytes())
+        return out.getvalue()
+
+    async def stream(self, text: str) -> AsyncIterator[bytes]:
+        data = self.render(text)
+        for start in range(0, len(data), self.chunk_bytes):
+            if self.chunk_delay:
+                await asyncio.sleep(self.chunk_delay)
+            yield data[start:start + self.chunk_bytes]
+
+
+def producer_from_env(voice: str) -> TTSProducer:
+    """TTS_BACKEND=edge (default) or "stub" for offline runs (demos, load tests)."""
+    if os.getenv("TTS_BACKEND", "edge").lower() == "stub":
+        logger.info("[INIT] Using offline stub TTS backend")
+        # 8 kHz 16-bit WAV: a few times edge-tts' MP3 bitrate, so fan-out volume stays realistic
+        return FakeTTSProducer(sample_rate=8000)
+    return EdgeTTSProducer(voice)
@@ -1,70 +1,122 @@
 import asyncio
-import sounddevice as sd
+from contextlib import aclosing, nullcontext
+import base64
+import uuid
 import numpy as np
-import scipy.io.wavfile as wav
 import os
-import tempfile
-import edge_tts
 from faster_whisper import WhisperModel
+from . import audio_device
+from .audio_device import require_sounddevice
 from .logger import logger
+from .barge_in import BargeInMonitor
+from .asr_rescoring import LexiconRescorer, RescoredTranscript
+from .asr_tiers import AsrTierPolicy, TieredTranscriber
+from .admission import Overloaded, admission
+from .audio_playback import PcmBuffer, PcmPlayer, decode_into
+from .tts import TTSProducer, producer_from_env
 
-# Suppress pygame banner
-os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
-import pygame
+
+# Coalesce edge-tts frames into websocket messages of at least this size
+STREAM_CHUNK_BYTES = 4096
 
 
 class VoiceInterface:
-    def __init__(self, input_lang: str = "te", output_voice: str = "te-IN-ShrutiNeural"):
+    def __init__(
+        self,
+        input_lang: str = "te",
+        output_voice: str = "te-IN-ShrutiNeural",
+        audio_sink=None,
+        tts: TTSProducer | None = None,
+    ):
         self.input_lang = input_lang or "te"
         self.output_voice = output_voice
+        self.tts = tts or producer_from_env(output_voice)
+        # "browser": stream encoded chunks to dashboard clients via `audio_sink` (no server sound device)
+        # "local": decode in memory and play on this machine's speakers
+        self.output_mode = os.getenv("AUDIO_OUTPUT", "browser").lower()
+        if self.output_mode == "browser" and audio_sink is None:
+            logger.warning("No audio sink given for browser output; falling back to local playback.")
+            self.output_mode = "local"
+        self.audio_sink = audio_sink
+        if audio_device.sounddevice is None:
+            logger.warning("No PortAudio on this machine: microphone input and local playback are disabled.")
         self.sample_rate = 16000
         self.channels = 1
         # Short window for responsiveness; increase if needed
         self.duration = 4
 
         self.model: WhisperModel | None = None
+        self.models: dict[str, WhisperModel] = {}
+        self.tier_policy = AsrTierPolicy()
         self._load_model()
 
-        # Init pygame mixer for audio playback
-        try:
-            pygame.mixer.init()
-        except Exception as e:
-            logger.warning(f"Audio Output setup failed: {e}")
+        # Full-duplex barge-in: mic stays open while the agent thinks/speaks
+        self.barge_in_enabled = os.getenv("BARGE_IN", "1").lower() not in ("0", "false", "off")
+        self.barge_in = BargeInMonitor(
+            sample_rate=self.sample_rate,
+            energy_threshold=float(os.getenv("BARGE_IN_THRESHOLD", "0.02")),
+        )
+        self.rescorer = LexiconRescorer()
+        # Encoded bytes of fixed prompts (e.g. the overload hold prompt), synthesized once
+        self._tts_cache: dict[str, bytes] = {}
+        self.transcriber = TieredTranscriber(
+            self.models, self.tier_policy, self.rescorer, language=self.input_lang, sample_rate=self.sample_rate
+        )
+        # Local playback: one reusable PCM buffer and a persistent output stream (opened on first use)
+        self.pcm = PcmBuffer()
+        self.player = PcmPlayer()
 
     def _load_model(self):
         """
-        Load Whisper model for Telugu recognition.
+        Load the Whisper models the tier policy needs (int8, CPU).
         Strategy:
-        - Prefer 'small' with int8 for better accuracy.
-        - Fallback to 'tiny' if 'small' is unavailable.
+        - "adaptive" loads both 'tiny' (fast first pass) and 'small' (accuracy).
+        - If 'small' is unavailable, everything is decoded with 'tiny'.
         """
-        try:
-            logger.info("[INIT] Loading Whisper Model (small, int8, Telugu)...")
-            self.model = WhisperModel("small", device="cpu", compute_type="int8")
-            logger.info("[INIT] Whisper (small, int8) Loaded.")
-        except Exception as e:
-            logger.warning(f"Failed to load 'small' model: {e}. Falling back to 'tiny'.")
+        for tier in self.tier_policy.required_tiers():
+            try:
+                logger.info(f"[INIT] Loading Whisper Model ({tier}, int8, Telugu)...")
+                self.models[tier] = WhisperModel(tier, device="cpu", compute_type="int8")
+                logger.info(f"[INIT] Whisper ({tier}, int8) Loaded.")
+            except Exception as e:
+                logger.warning(f"Failed to load '{tier}' model: {e}")
+
+        if not self.models:
+            logger.warning("Falling back to 'tiny'.")
             try:
-                logger.info("[INIT] Loading Whisper Model (tiny, int8, Telugu)...")
-                self.model = WhisperModel("tiny", device="cpu", compute_type="int8")
-                logger.info("[INIT] Whisper (tiny, int8) Loaded.")
+                self.models["tiny"] = WhisperModel("tiny", device="cpu", compute_type="int8")
             except Exception as e2:
                 logger.critical(f"All Whisper models failed: {e2}")
-                self.model = None
+        self.model = self.models.get("small") or self.models.get("tiny")
 
     def listen_with_quality(self) -> tuple[str, float]:
         """
         Records audio for fixed duration and transcribes using Whisper.
         Returns (transcript_text, quality_score) where quality is in [0,1].
         """
-        if not self.model:
-            logger.error("Whisper Model missing. Check logs for load failure.")
-            return "", 0.0
+        result = self.listen_with_details()
+        return result.text, result.quality
 
-        logger.info(f"[LISTENING] Recording for {self.duration} seconds...")
+    def listen_with_details(self, profile: dict | None = None) -> RescoredTranscript:
+        """
+        Records and transcribes like `listen_with_quality`, then rescores the
+        word-level hypotheses against the scheme/profile lexicon. The result
+        lists any words that are still uncertain.
+        """
+        return self.transcribe(self.record(), profile)
 
+    def record(self) -> np.ndarray | None:
+        """Returns the pending barge-in capture, or records `duration` seconds (int16)."""
         try:
+            # An utterance captured while the agent was talking takes priority
+            recording = self.barge_in.take_capture()
+            if recording is not None:
+                logger.info("[LISTENING] Using barge-in capture (%.1fs)", len(recording) / self.sample_rate)
+                return recording
+
+            logger.info("[LISTENING] Recording for %s seconds...", self.duration)
             num_samples = int(self.duration * self.sample_rate)
+            sd = require_sounddevice()
             recording = sd.rec(
                 num_samples,
                 samplerate=self.sample_rate,
@@ -72,66 +124,44 @@ class VoiceInterface:
                 dtype="int16",
             )
             sd.wait()
+            return recording
+        except Exception as e:
+            logger.error(f"Audio Recording Error: {e}")
+            return None
 
+    def transcribe(self, recording: np.ndarray | None, profile: dict | None = None) -> RescoredTranscript:
+        """Transcribes a recording from `record` (the CPU-heavy part of listening)."""
+        empty = RescoredTranscript(text="", quality=0.0)
+        if not self.model:
+            logger.error("Whisper Model missing. Check logs for load failure.")
+            return empty
+        if recording is None:
+            return empty
+
+        try:
             # Quick energy check to ignore pure silence / very low audio
             audio_float = recording.astype("float32") / 32768.0
             energy = float(np.mean(np.abs(audio_float)))
             if energy < 0.002:
                 logger.info("[LISTENING] Detected near-silence, ignoring turn.")
-                return "", 0.0
+                return empty
 
             logger.info("[PROCESSING] Transcribing with Whisper (Telugu)...")
+            result = self.transcriber.transcribe(audio_float.reshape(-1), profile)
+            if not result.text:
+                return empty
 
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-            temp_path = temp_file.name
-            temp_file.close()
-
-            wav.write(temp_path, self.sample_rate, recording)
-
-            # Domain prompt to bias towards govt schemes
-            keywords_prompt = (
-                "నమస్కారం, తెలంగాణ ప్రభుత్వం సంక్షేమ పథకాలు, రైతు బంధు, ఆసరా పెన్షన్, "
-                "కళ్యాణ లక్ష్మి, విత్తనాలు, ఎకరాలు, ఆదాయం, వయస్సు."
-            )
-            segments, info = self.model.transcribe(
-                temp_path,
-                beam_size=3,
-                language=self.input_lang,
-                initial_prompt=keywords_prompt,
-                condition_on_previous_text=False,
-                vad_filter=True,
+            for w in result.corrections:
+                logger.info("[ASR][Rescore] %r -> %r", w.corrected_from, w.text)
+            logger.info(
+                "[USER][Whisper] text=%r (tier=%s, quality=%.2f)", result.text, result.tier, result.quality,
+                extra={"fields": {"transcript": result.text, "asr_tier": result.tier, "asr_quality": result.quality}},
             )
-
-            text_blocks = []
-            for segment in segments:
-                text_blocks.append(segment.text)
-
-            final_text = " ".join(text_blocks).strip()
-
-            quality = 0.0
-            if final_text:
-                # language_probability is in [0,1]
-                lang_prob = getattr(info, "language_probability", 0.0) or 0.0
-                telugu_chars = [
-                    ch for ch in final_text
-                    if "\u0c00" <= ch <= "\u0c7f"
-                ]
-                ratio = len(telugu_chars) / max(len(final_text), 1)
-                quality = float(lang_prob) * float(ratio)
-
-                logger.info(
-                    f"[USER][Whisper] text='{final_text}' "
-                    f"(lang_prob={lang_prob:.2f}, te_ratio={ratio:.2f}, quality={quality:.2f})"
-                )
-
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-
-            return final_text, quality
+            return result
 
         except Exception as e:
             logger.error(f"Audio/Transcription Error (Whisper): {e}")
-            return "", 0.0
+            return empty
 
     def listen(self) -> str:
         """
@@ -140,50 +170,157 @@ class VoiceInterface:
         text, _ = self.listen_with_quality()
         return text
 
-    async def speak(self, text: str):
+    def start_barge_in(self) -> bool:
+        """Starts watching the mic for caller speech. Returns False if unavailable."""
+        if not self.barge_in_enabled:
+            return False
+        try:
+            self.barge_in.start()
+            return True
+        except Exception as e:
+            logger.warning(f"Barge-in monitor unavailable: {e}")
+            self.barge_in_enabled = False
+            return False
+
+    def stop_barge_in(self):
+        """Stops the monitor unless it holds an interrupting utterance for the next listen."""
+        if not self.barge_in.triggered.is_set():
+            self.barge_in.stop()
+
+    def stop_playback(self):
+        self.player.stop()
+
+    async def speak(self, text: str, cache: bool = False):
         """
-        Converts text to speech and plays it using pygame.
-        Uses Edge TTS neural Telugu voice.
-        Optimized for faster response - TTS generation happens in background.
+        Converts text to speech with the TTS producer (Edge neural Telugu voice by
+        default) and plays it, either in the browser (streamed) or locally.
+        `cache=True` keeps the audio for fixed prompts and skips admission control.
+        Raises Overloaded when the TTS stage sheds the request.
         """
         if not text:
             return
 
-        logger.info(f"[AGENT]: {text}")
+        logger.info("[AGENT]: %s", text, extra={"fields": {"reply_chars": len(text)}})
+
+        if self.output_mode == "browser":
+            await self._stream_to_browser(text, cache)
+        else:
+            await self._play_local(text, cache)
 
-        communicate = edge_tts.Communicate(text, self.output_voice)
+    async def warm_prompt(self, text: str):
+        """Synthesizes a fixed prompt into the cache so it can play even when TTS is saturated."""
+        try:
+            async with aclosing(self._audio_chunks(text, True)) as chunks:
+                async for _ in chunks:
+                    pass
+        except Exception as e:
+            logger.warning(f"Could not pre-synthesize prompt: {e}")
+
+    async def _audio_chunks(self, text: str, cache: bool):
+        """Yields encoded audio for `text`, from the prompt cache or from the TTS producer."""
+        if cache and text in self._tts_cache:
+            yield self._tts_cache[text]
+            return
+
+        collected = bytearray() if cache else None
+        async with (nullcontext() if cache else admission.stage("tts")):
+            async for data in self.tts.stream(text):
+                if collected is not None:
+                    collected.extend(data)
+                yield data
+        if collected:
+            self._tts_cache[text] = bytes(collected)
+
+    async def _stream_to_browser(self, text: str, cache: bool = False):
+        """
+        Streams encoded chunks to the dashboard as the TTS producer emits them, then waits
+        until a client reports playback finished (bounded by the audio length).
+        """
+        utterance_id = uuid.uuid4().hex[:12]
+        sent_bytes = 0
+        seq = 0
+        pending = bytearray()
 
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
-        temp_path = temp_file.name
-        temp_file.close()
+        async def flush():
+            nonlocal seq, sent_bytes
+            if not pending:
+                return
+            await self.audio_sink.broadcast({
+                "type": "audio_chunk",
+                "payload": {"id": utterance_id, "seq": seq, "data": base64.b64encode(pending).decode("ascii")},
+            })
+            sent_bytes += len(pending)
+            seq += 1
+            pending.clear()
 
+        started = False
         try:
-            # Generate TTS asynchronously (already async, no blocking)
-            await communicate.save(temp_path)
-
-            # Play using Pygame (non-blocking start)
-            pygame.mixer.music.load(temp_path)
-            pygame.mixer.music.play()
-            
-            # Optimized wait - check more frequently initially for faster response
-            # Reduced initial wait time from 100ms to 50ms for better responsiveness
-            check_count = 0
-            while pygame.mixer.music.get_busy():
-                # Check more frequently at start (every 50ms), then less frequently
-                if check_count < 10:
-                    await asyncio.sleep(0.05)  # 50ms for first 500ms - faster response
-                else:
-                    await asyncio.sleep(0.1)   # 100ms after that
-                check_count += 1
-
-            # Unload to release file lock
-            pygame.mixer.music.unload()
+            # aclosing: release the TTS slot right away if we are cancelled mid-stream
+            async with aclosing(self._audio_chunks(text, cache)) as chunks:
+                # The first chunk holds the TTS admission slot, so a shed request
+                # (Overloaded) is raised before clients are told anything
+                first = await anext(chunks, None)
+                if first is None:
+                    return
+                # Registered up front: a client can finish (or fail to autoplay) before audio_end is sent
+                self.audio_sink.expect_playback(utterance_id)
+                started = True
+                await self.audio_sink.broadcast(
+                    {"type": "audio_start", "payload": {"id": utterance_id, "mime": self.tts.mime}}
+                )
+                pending.extend(first)
+                async for data in chunks:
+                    pending.extend(data)
+                    if len(pending) >= STREAM_CHUNK_BYTES:
+                        await flush()
+            await flush()
+            await self.audio_sink.broadcast({"type": "audio_end", "payload": {"id": utterance_id}})
+
+            # Client plays while chunks arrive; give it the clip length plus slack to finish
+            timeout = sent_bytes / self.tts.bytes_per_second + 1.5
+            await self.audio_sink.wait_playback_done(utterance_id, timeout)
 
+        except Overloaded:
+            raise  # the caller plays the hold prompt
+        except asyncio.CancelledError:
+            # Barge-in: tell clients to drop whatever is buffered
+            if started:
+                await self.audio_sink.broadcast({"type": "audio_stop", "payload": {"id": utterance_id}})
+            raise
         except Exception as e:
-            logger.error(f"TTS Playback Error: {e}")
+            logger.error(f"TTS Streaming Error: {e}")
+            if started:
+                await self.audio_sink.broadcast({"type": "audio_stop", "payload": {"id": utterance_id}})
         finally:
-            if os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except Exception:
-                    pass
+            self.audio_sink.forget_playback(utterance_id)
+
+    async def _play_local(self, text: str, cache: bool = False):
+        """
+        Collects the synthesized audio in memory, decodes it into the reusable
+        PCM buffer and plays it through the output stream; returns when the
+        stream's callback reports the last frame played.
+        """
+        try:
+            encoded = bytearray()
+            async with aclosing(self._audio_chunks(text, cache)) as chunks:
+                async for data in chunks:
+                    encoded.extend(data)
+            if not encoded:
+                return
+            # The worker thread cannot be cancelled; on barge-in wait for it to finish
+            # writing into self.pcm so the next speak() never shares the buffer with it
+            decode = asyncio.ensure_future(
+                asyncio.to_thread(decode_into, bytes(encoded), self.pcm, self.player.sample_rate)
+            )
+            try:
+                frames = await asyncio.shield(decode)
+            except asyncio.CancelledError:
+                await asyncio.wait({decode})
+                raise
+            logger.debug("[TTS] Decoded %d bytes -> %.2fs PCM", len(encoded), frames / self.player.sample_rate)
+            # Cancellation (barge-in) stops the player inside play()
+            await self.player.play(self.pcm)
+        except Overloaded:
+            raise  # the caller plays the hold prompt
+        except Exception as e:
+            logger.error(f"TTS Playback Error: {e}")